@@ -0,0 +1,30 @@
+"""Add a (kind, name) index for respondent listing queries.
+
+Respondent listing, search and count filter by an optional kind and always
+order by name. ix_respondents_kind_name serves the kind-filtered listings
+in name order; unfiltered listings already use ix_respondents_name.
+
+Revision ID: 20261016_000001
+Revises: 20260208_000001
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000001"
+down_revision: str | None = "20260208_000001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the (kind, name) index on respondents."""
+    op.create_index("ix_respondents_kind_name", "respondents", ["kind", "name"])
+
+
+def downgrade() -> None:
+    """Drop the (kind, name) index on respondents."""
+    op.drop_index("ix_respondents_kind_name", table_name="respondents")
@@ -0,0 +1,57 @@
+"""Add an indexed assessment_id to attachments.
+
+Draft cleanup used to find an assessment's images by storage_key prefix
+(assessments/{assessment_id}/...). The new column lets it use a B-tree
+lookup instead. Existing rows are backfilled from that key prefix. The
+foreign key uses SET NULL so deleting an assessment leaves its attachment
+rows for orphaned-image cleanup, which also removes the stored object.
+
+Revision ID: 20261016_000002
+Revises: 20261016_000001
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20261016_000002"
+down_revision: str | None = "20261016_000001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add, backfill, and index attachments.assessment_id."""
+    op.add_column("attachments", sa.Column("assessment_id", sa.UUID(), nullable=True))
+    op.create_foreign_key(
+        "fk_attachments_assessment_id",
+        "attachments",
+        "assessments",
+        ["assessment_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    # Compare as text so keys that are not assessments/{uuid}/... are skipped
+    # instead of failing the cast
+    op.execute(
+        """
+        UPDATE attachments AS at
+        SET assessment_id = a.id
+        FROM assessments AS a
+        WHERE at.storage_key LIKE 'assessments/%'
+          AND a.id::text = split_part(at.storage_key, '/', 2)
+        """
+    )
+
+    op.create_index(op.f("ix_attachments_assessment_id"), "attachments", ["assessment_id"])
+
+
+def downgrade() -> None:
+    """Drop attachments.assessment_id."""
+    op.drop_index(op.f("ix_attachments_assessment_id"), table_name="attachments")
+    op.drop_constraint("fk_attachments_assessment_id", "attachments", type_="foreignkey")
+    op.drop_column("attachments", "assessment_id")
@@ -12,6 +12,7 @@ from src.repositories.question_group import QuestionGroupRepository
 from src.repositories.questionnaire_type import QuestionnaireTypeRepository
 from src.schemas.common import PaginatedResponse
 from src.schemas.question_group import (
+    QUESTION_GROUP_LIST_ADAPTER,
     QuestionGroupCreate,
     QuestionGroupResponse,
     QuestionGroupUpdate,
@@ -69,7 +70,7 @@ async def list_groups(
     total = await repo.count(type_id=type_id, is_active=is_active)
 
     return PaginatedResponse.create(
-        items=[QuestionGroupResponse.model_validate(g) for g in groups],
+        items=QUESTION_GROUP_LIST_ADAPTER.validate_python(groups, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
@@ -13,12 +13,17 @@ from src.repositories.question_group import QuestionGroupRepository
 from src.repositories.question_option import QuestionOptionRepository
 from src.schemas.common import PaginatedResponse
 from src.schemas.question import (
+    QUESTION_LIST_ADAPTER,
     QuestionCreate,
     QuestionResponse,
     QuestionUpdate,
     QuestionWithOptionsResponse,
 )
-from src.schemas.question_option import QuestionOptionResponse, QuestionOptionsSet
+from src.schemas.question_option import (
+    QUESTION_OPTION_LIST_ADAPTER,
+    QuestionOptionResponse,
+    QuestionOptionsSet,
+)
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
@@ -76,7 +81,7 @@ async def list_questions(
     total = await repo.count_by_group(group_id, is_active=is_active)
 
     return PaginatedResponse.create(
-        items=[QuestionResponse.model_validate(q) for q in questions],
+        items=QUESTION_LIST_ADAPTER.validate_python(questions, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
@@ -111,7 +116,9 @@ async def get_question(
         weight=question.weight,
         is_critical=question.is_critical,
         is_active=question.is_active,
-        options=[QuestionOptionResponse.model_validate(o) for o in question.options],
+        options=QUESTION_OPTION_LIST_ADAPTER.validate_python(
+            question.options, from_attributes=True
+        ),
     )
 
 
@@ -169,4 +176,4 @@ async def set_question_options(
     option_repo = QuestionOptionRepository(session)
     created_options = await option_repo.set_options(question_id, options)
 
-    return [QuestionOptionResponse.model_validate(o) for o in created_options]
+    return QUESTION_OPTION_LIST_ADAPTER.validate_python(created_options, from_attributes=True)
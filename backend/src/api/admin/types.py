@@ -11,6 +11,7 @@ from src.core.database import get_session
 from src.repositories.questionnaire_type import QuestionnaireTypeRepository
 from src.schemas.common import PaginatedResponse
 from src.schemas.questionnaire_type import (
+    QUESTIONNAIRE_TYPE_LIST_ADAPTER,
     QuestionnaireTypeCreate,
     QuestionnaireTypeResponse,
     QuestionnaireTypeUpdate,
@@ -63,7 +64,7 @@ async def list_types(
     total = await repo.count(is_active=is_active)
 
     return PaginatedResponse.create(
-        items=[QuestionnaireTypeResponse.model_validate(t) for t in types],
+        items=QUESTIONNAIRE_TYPE_LIST_ADAPTER.validate_python(types, from_attributes=True),
         total=total,
         page=page,
         page_size=page_size,
@@ -14,10 +14,14 @@ from src.core.rate_limit import PUBLIC_RATE_LIMIT
 from src.schemas.attachment import AttachmentUpload
 from src.schemas.draft import DraftResponse, DraftSaveRequest, DraftSaveResponse
 from src.schemas.public import (
+    AnswerBreakdownItem,
     AssessmentErrorResponse,
     AssessmentFormResponse,
+    GroupResult,
+    OverallResult,
     SubmitRequest,
     SubmitResponse,
+    TypeResult,
 )
 from src.services.assessment import AssessmentService
 from src.services.draft import DraftService
@@ -335,8 +339,6 @@ async def get_public_results(
         )
 
     # Convert to SubmitResponse format (matching what submit endpoint returns)
-    from src.schemas.public import AnswerBreakdownItem, GroupResult, OverallResult, TypeResult
-
     type_results = [
         TypeResult(
             type_id=str(ts.type_id),
@@ -17,6 +17,7 @@ from src.core.database import (
 from src.core.rate_limit import PUBLIC_RATE_LIMIT, get_rate_limit_string, limiter
 from src.core.storage import (
     delete_file,
+    delete_files,
     ensure_bucket_exists,
     generate_storage_key,
     get_presigned_url,
@@ -50,6 +51,7 @@ __all__ = [
     "generate_storage_key",
     "upload_file",
     "delete_file",
+    "delete_files",
     "get_presigned_url",
     "ensure_bucket_exists",
 ]
@@ -22,6 +22,11 @@ def create_engine() -> AsyncEngine:
         pool_size=5,
         max_overflow=10,
         pool_pre_ping=True,
+        # Reuse server-side prepared statements for repeated parameterized queries
+        connect_args={
+            "prepared_statement_cache_size": settings.database_statement_cache_size,
+            "statement_cache_size": settings.database_statement_cache_size,
+        },
     )
 
 
@@ -1,5 +1,6 @@
 """S3/MinIO object storage client and helpers."""
 
+import logging
 import uuid
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -9,6 +10,8 @@ from botocore.config import Config
 
 from src.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 def get_s3_config() -> dict:
     """Get S3 client configuration."""
@@ -102,6 +105,51 @@ async def delete_file(storage_key: str) -> None:
         )
 
 
+# S3 DeleteObjects accepts at most 1000 keys per request
+_DELETE_BATCH_SIZE = 1000
+
+
+async def delete_files(storage_keys: list[str]) -> set[str]:
+    """Delete many files from S3/MinIO with batched DeleteObjects requests.
+
+    Uses one client and one request per 1000 keys. A failed request is
+    logged and the remaining batches are still sent; keys S3 reports in the
+    response's Errors list are logged too. Neither raises.
+
+    Args:
+        storage_keys: The S3 object keys to delete.
+
+    Returns:
+        The keys that could not be deleted.
+    """
+    failed: set[str] = set()
+    if not storage_keys:
+        return failed
+    async with get_s3_client() as client:
+        for start in range(0, len(storage_keys), _DELETE_BATCH_SIZE):
+            batch = storage_keys[start : start + _DELETE_BATCH_SIZE]
+            try:
+                response = await client.delete_objects(
+                    Bucket=settings.s3_bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            except Exception:
+                logger.exception(
+                    "DeleteObjects failed for %d keys starting at %s", len(batch), batch[0]
+                )
+                failed.update(batch)
+                continue
+            for error in response.get("Errors", []):
+                logger.warning(
+                    "Failed to delete %s: %s %s",
+                    error.get("Key"),
+                    error.get("Code"),
+                    error.get("Message"),
+                )
+                failed.add(error.get("Key"))
+    return failed
+
+
 async def get_presigned_url(storage_key: str, expires_in: int = 3600) -> str:
     """Generate a presigned URL for downloading a file.
 
@@ -50,6 +50,8 @@ Public endpoints are rate-limited and accessed via one-time tokens.
     """,
     debug=settings.debug,
     lifespan=lifespan,
+    # Without /openapi.json the model JSON schemas (and their descriptions) are never built
+    openapi_url=None if settings.schemas_minimal else "/openapi.json",
     openapi_tags=[
         {
             "name": "root",
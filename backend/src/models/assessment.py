@@ -13,6 +13,7 @@ from src.models.enums import AssessmentStatus
 
 if TYPE_CHECKING:
     from src.models.assessment_draft import AssessmentDraft
+    from src.models.assessment_score import AssessmentScore
     from src.models.respondent import Respondent
     from src.models.submission_contact import SubmissionContact
 
@@ -105,6 +106,11 @@ class Assessment(BaseModel):
         back_populates="assessment",
         uselist=False,
     )
+    # Read side only: scores are written by ScoringService as standalone rows
+    scores: Mapped[list["AssessmentScore"]] = relationship(
+        "AssessmentScore",
+        viewonly=True,
+    )
 
     def __repr__(self) -> str:
         return f"<Assessment(id={self.id}, status={self.status}, respondent_id={self.respondent_id})>"
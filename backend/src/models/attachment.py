@@ -15,6 +15,7 @@ class Attachment(BaseModel):
 
     Attributes:
         answer_id: Reference to parent Answer.
+        assessment_id: Assessment the image was uploaded for.
         storage_key: S3/MinIO object key.
         original_name: Original filename.
         size_bytes: File size in bytes.
@@ -29,6 +30,12 @@ class Attachment(BaseModel):
         nullable=False,
         index=True,
     )
+    assessment_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("assessments.id", ondelete="SET NULL", name="fk_attachments_assessment_id"),
+        nullable=True,
+        index=True,
+    )
     storage_key: Mapped[str] = mapped_column(
         String(500),
         nullable=False,
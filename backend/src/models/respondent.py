@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModelWithTimestamps
@@ -23,6 +23,10 @@ class Respondent(BaseModelWithTimestamps):
     """
 
     __tablename__ = "respondents"
+    __table_args__ = (
+        # Kind-filtered listings ordered by name
+        Index("ix_respondents_kind_name", "kind", "name"),
+    )
 
     kind: Mapped[RespondentKind] = mapped_column(
         SAEnum(RespondentKind, name="respondent_kind"),
@@ -0,0 +1,11 @@
+"""Shared helpers for repository modules."""
+
+from decimal import Decimal
+from typing import Any
+
+
+def weight_to_decimal(values: dict[str, Any]) -> dict[str, Any]:
+    """Convert the schema's float weight to Decimal for the Numeric column."""
+    if values.get("weight") is not None:
+        values["weight"] = Decimal(str(values["weight"]))
+    return values
@@ -4,8 +4,9 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.models.assessment import Assessment
 from src.models.enums import AssessmentStatus
@@ -49,6 +50,15 @@ class AssessmentRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_by_id_with_respondent(self, assessment_id: UUID) -> Assessment | None:
+        """Get an assessment by ID with respondent loaded."""
+        result = await self.session.execute(
+            select(Assessment)
+            .where(Assessment.id == assessment_id)
+            .options(selectinload(Assessment.respondent))
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_token_hash(self, token_hash: str) -> Assessment | None:
         """Get an assessment by token hash."""
         result = await self.session.execute(
@@ -65,8 +75,16 @@ class AssessmentRepository:
         offset: int = 0,
         limit: int = 100,
     ) -> list[Assessment]:
-        """Get all assessments with optional filtering."""
-        stmt = select(Assessment).order_by(Assessment.created_at.desc())
+        """Get all assessments with optional filtering.
+
+        Respondents are eager-loaded in one extra query so list responses
+        can read respondent fields without a lazy load per row.
+        """
+        stmt = (
+            select(Assessment)
+            .options(selectinload(Assessment.respondent))
+            .order_by(Assessment.created_at.desc())
+        )
 
         if respondent_id is not None:
             stmt = stmt.where(Assessment.respondent_id == respondent_id)
@@ -89,8 +107,6 @@ class AssessmentRepository:
         employee_id: str | None = None,
     ) -> int:
         """Count assessments with optional filtering."""
-        from sqlalchemy import func
-
         stmt = select(func.count(Assessment.id))
 
         if respondent_id is not None:
@@ -2,11 +2,12 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.models.question import Question
+from src.models.question_group import QuestionGroup
 from src.schemas.question import QuestionCreate, QuestionUpdate
 
 
@@ -104,10 +105,29 @@ class QuestionRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_active_by_type_ids_with_options(self, type_ids: list[UUID]) -> list[Question]:
+        """Get active questions in the active groups of multiple types.
+
+        Options are joined into the same query, so questions and options
+        load in one round trip.
+        """
+        if not type_ids:
+            return []
+        result = await self.session.execute(
+            select(Question)
+            .join(QuestionGroup, Question.group_id == QuestionGroup.id)
+            .where(
+                QuestionGroup.type_id.in_(type_ids),
+                QuestionGroup.is_active == True,  # noqa: E712
+                Question.is_active == True,  # noqa: E712
+            )
+            .options(joinedload(Question.options))
+            .order_by(Question.group_id, Question.display_order)
+        )
+        return list(result.unique().scalars().all())
+
     async def count_by_group(self, group_id: UUID, *, is_active: bool | None = None) -> int:
         """Count questions for a question group."""
-        from sqlalchemy import func
-
         stmt = select(func.count(Question.id)).where(Question.group_id == group_id)
 
         if is_active is not None:
@@ -127,8 +147,6 @@ class QuestionRepository:
 
     async def get_next_display_order(self, group_id: UUID) -> int:
         """Get the next display order for a new question in a group."""
-        from sqlalchemy import func
-
         result = await self.session.execute(
             select(func.coalesce(func.max(Question.display_order), -1) + 1).where(
                 Question.group_id == group_id
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.models.question_group import QuestionGroup
+from src.repositories._utils import weight_to_decimal
 from src.schemas.question_group import QuestionGroupCreate, QuestionGroupUpdate
 
 
@@ -18,7 +19,7 @@ class QuestionGroupRepository:
 
     async def create(self, data: QuestionGroupCreate) -> QuestionGroup:
         """Create a new question group."""
-        question_group = QuestionGroup(**data.model_dump())
+        question_group = QuestionGroup(**weight_to_decimal(data.model_dump()))
         self.session.add(question_group)
         await self.session.flush()
         await self.session.refresh(question_group)
@@ -109,7 +110,7 @@ class QuestionGroupRepository:
         data: QuestionGroupUpdate,
     ) -> QuestionGroup:
         """Update a question group."""
-        update_data = data.model_dump(exclude_unset=True)
+        update_data = weight_to_decimal(data.model_dump(exclude_unset=True))
         for field, value in update_data.items():
             setattr(question_group, field, value)
         await self.session.flush()
@@ -2,10 +2,11 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.questionnaire_type import QuestionnaireType
+from src.repositories._utils import weight_to_decimal
 from src.schemas.questionnaire_type import QuestionnaireTypeCreate, QuestionnaireTypeUpdate
 
 
@@ -17,7 +18,7 @@ class QuestionnaireTypeRepository:
 
     async def create(self, data: QuestionnaireTypeCreate) -> QuestionnaireType:
         """Create a new questionnaire type."""
-        questionnaire_type = QuestionnaireType(**data.model_dump())
+        questionnaire_type = QuestionnaireType(**weight_to_decimal(data.model_dump()))
         self.session.add(questionnaire_type)
         await self.session.flush()
         await self.session.refresh(questionnaire_type)
@@ -49,8 +50,6 @@ class QuestionnaireTypeRepository:
 
     async def count(self, *, is_active: bool | None = None) -> int:
         """Count questionnaire types with optional filtering."""
-        from sqlalchemy import func
-
         stmt = select(func.count(QuestionnaireType.id))
 
         if is_active is not None:
@@ -65,7 +64,7 @@ class QuestionnaireTypeRepository:
         data: QuestionnaireTypeUpdate,
     ) -> QuestionnaireType:
         """Update a questionnaire type."""
-        update_data = data.model_dump(exclude_unset=True)
+        update_data = weight_to_decimal(data.model_dump(exclude_unset=True))
         for field, value in update_data.items():
             setattr(questionnaire_type, field, value)
         await self.session.flush()
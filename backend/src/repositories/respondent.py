@@ -2,9 +2,10 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, exists, func, lambda_stmt, select, union_all, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.models.enums import RespondentKind
 from src.models.respondent import Respondent
@@ -53,36 +54,27 @@ class RespondentRepository:
         """Create or update a respondent from Odoo data.
 
         Strategy:
-        1. Try INSERT ON CONFLICT on odoo_id → update name/registration_no.
-        2. If no conflict (new odoo_id), check for legacy match by kind+registration_no
-           to link an existing respondent.
-        3. If still no match, create new.
+        1. One statement with two data-modifying CTEs: UPDATE by odoo_id to
+           refresh a known respondent, and, only if that matched nothing, link
+           a legacy respondent (same kind + registration_no, no odoo_id yet).
+           Both lookups share a single round trip.
+        2. If neither matched, INSERT ON CONFLICT on odoo_id for atomicity.
+
+        Without a registration_no there is nothing to link, so step 2 alone
+        covers both the new and the existing case.
 
         Returns the resolved Respondent instance.
         """
-        # First, try to find by odoo_id
-        existing = await self.get_by_odoo_id(odoo_id)
-        if existing is not None:
-            # Update name and registration_no to latest Odoo data
-            existing.name = name
-            existing.registration_no = registration_no
-            await self.session.flush()
-            await self.session.refresh(existing)
-            return existing
-
-        # Try legacy linking: match by kind + registration_no
         if registration_no is not None:
-            legacy = await self.find_by_kind_and_registration(kind, registration_no)
-            if legacy is not None:
-                # Link this legacy respondent to the Odoo ID
-                legacy.odoo_id = odoo_id
-                legacy.name = name
-                legacy.registration_no = registration_no
-                await self.session.flush()
-                await self.session.refresh(legacy)
-                return legacy
-
-        # No match found — use INSERT ON CONFLICT for atomicity
+            resolved = await self._update_known_or_legacy(
+                odoo_id=odoo_id,
+                name=name,
+                kind=kind,
+                registration_no=registration_no,
+            )
+            if resolved is not None:
+                return resolved
+
         stmt = pg_insert(Respondent).values(
             odoo_id=odoo_id,
             name=name,
@@ -97,10 +89,54 @@ class RespondentRepository:
             },
         ).returning(Respondent)
 
-        result = await self.session.execute(stmt)
-        respondent = result.scalar_one()
-        await self.session.refresh(respondent)
-        return respondent
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
+
+    async def _update_known_or_legacy(
+        self,
+        *,
+        odoo_id: str,
+        name: str,
+        kind: RespondentKind,
+        registration_no: str,
+    ) -> Respondent | None:
+        """Update the respondent for odoo_id, else link a legacy one; None if neither."""
+        table = Respondent.__table__
+        by_odoo = (
+            update(table)
+            .where(table.c.odoo_id == odoo_id)
+            .values(name=name, registration_no=registration_no)
+            .returning(*table.c)
+            .cte("by_odoo")
+        )
+        # Link at most one legacy row (the oldest); odoo_id is unique
+        legacy_id = (
+            select(table.c.id)
+            .where(
+                table.c.kind == kind,
+                table.c.registration_no == registration_no,
+                table.c.odoo_id.is_(None),
+            )
+            .order_by(table.c.created_at, table.c.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        legacy = (
+            update(table)
+            .where(table.c.id == legacy_id, ~exists(select(by_odoo.c.id)))
+            .values(odoo_id=odoo_id, name=name)
+            .returning(*table.c)
+            .cte("legacy")
+        )
+        stmt = select(Respondent).from_statement(
+            union_all(select(by_odoo), select(legacy))
+        )
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one_or_none()
 
     async def get_all(
         self,
@@ -110,17 +146,24 @@ class RespondentRepository:
         offset: int = 0,
         limit: int = 100,
     ) -> list[Respondent]:
-        """Get all respondents with optional filtering."""
-        stmt = select(Respondent).order_by(Respondent.name)
+        """Get all respondents with optional filtering.
+
+        Built as a lambda statement so the compiled SQL is cached across calls;
+        the ILIKE pattern is passed as a bound parameter. Relationships are
+        raiseload'ed so per-row lazy loads fail loudly instead of fanning out.
+        """
+        stmt = lambda_stmt(
+            lambda: select(Respondent).options(raiseload("*")).order_by(Respondent.name)
+        )
 
         if kind is not None:
-            stmt = stmt.where(Respondent.kind == kind)
+            stmt += lambda s: s.where(Respondent.kind == kind)
 
         if name_search:
-            stmt = stmt.where(Respondent.name.ilike(f"%{name_search}%"))
+            stmt += lambda s: s.where(Respondent.name.ilike(bindparam("name_pattern")))
 
-        stmt = stmt.offset(offset).limit(limit)
-        result = await self.session.execute(stmt)
+        stmt += lambda s: s.offset(offset).limit(limit)
+        result = await self.session.execute(stmt, _name_pattern_params(name_search))
         return list(result.scalars().all())
 
     async def count(
@@ -130,25 +173,34 @@ class RespondentRepository:
         name_search: str | None = None,
     ) -> int:
         """Count respondents with optional filtering."""
-        from sqlalchemy import func
-
-        stmt = select(func.count(Respondent.id))
+        stmt = lambda_stmt(lambda: select(func.count(Respondent.id)))
 
         if kind is not None:
-            stmt = stmt.where(Respondent.kind == kind)
+            stmt += lambda s: s.where(Respondent.kind == kind)
 
         if name_search:
-            stmt = stmt.where(Respondent.name.ilike(f"%{name_search}%"))
+            stmt += lambda s: s.where(Respondent.name.ilike(bindparam("name_pattern")))
 
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(stmt, _name_pattern_params(name_search))
         return result.scalar_one()
 
     async def search_by_name(self, name: str, limit: int = 10) -> list[Respondent]:
         """Search respondents by name (case-insensitive)."""
-        result = await self.session.execute(
-            select(Respondent)
-            .where(Respondent.name.ilike(f"%{name}%"))
+        stmt = lambda_stmt(
+            lambda: select(Respondent)
+            .options(raiseload("*"))
+            .where(Respondent.name.ilike(bindparam("name_pattern")))
             .order_by(Respondent.name)
             .limit(limit)
         )
+        # Always bound: unlike get_all/count the filter is unconditional, so an
+        # empty name matches every respondent ('%%'), as it always has
+        result = await self.session.execute(stmt, {"name_pattern": f"%{name}%"})
         return list(result.scalars().all())
+
+
+def _name_pattern_params(name_search: str | None) -> dict[str, str]:
+    """Build execute() parameters for the cached ILIKE name filter."""
+    if not name_search:
+        return {}
+    return {"name_pattern": f"%{name_search}%"}
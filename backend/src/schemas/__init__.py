@@ -1,83 +1,59 @@
 # Pydantic request/response schemas
-from src.schemas.assessment import (
-    AssessmentCreate,
-    AssessmentCreated,
-    AssessmentList,
-    AssessmentResponse,
-    AssessmentWithRespondent,
-)
-from src.schemas.draft import (
-    DraftAnswer,
-    DraftResponse,
-    DraftSaveRequest,
-    DraftSaveResponse,
-)
-from src.schemas.common import (
-    ErrorDetail,
-    ErrorResponse,
-    PaginatedResponse,
-    PaginationParams,
-    SuccessResponse,
-    ValidationErrorResponse,
-)
-from src.schemas.question import (
-    QuestionCreate,
-    QuestionResponse,
-    QuestionUpdate,
-    QuestionWithOptionsResponse,
-)
-from src.schemas.question_option import (
-    QuestionOptionConfig,
-    QuestionOptionResponse,
-    QuestionOptionsSet,
-)
-from src.schemas.questionnaire_type import (
-    QuestionnaireTypeCreate,
-    QuestionnaireTypeList,
-    QuestionnaireTypeResponse,
-    QuestionnaireTypeUpdate,
-)
-from src.schemas.respondent import (
-    RespondentInline,
-    RespondentList,
-    RespondentResponse,
-)
+#
+# Exports are resolved lazily (PEP 562) so importing one schema module, e.g.
+# ``src.schemas.results``, does not build every other model in the package.
+# ``_LAZY_EXPORTS`` is the single list of public names; ``__all__`` follows it.
+import importlib
+from typing import Any
 
-__all__ = [
-    # Draft
-    "DraftAnswer",
-    "DraftSaveRequest",
-    "DraftResponse",
-    "DraftSaveResponse",
-    # Common
-    "ErrorDetail",
-    "ErrorResponse",
-    "PaginatedResponse",
-    "PaginationParams",
-    "SuccessResponse",
-    "ValidationErrorResponse",
-    # QuestionnaireType
-    "QuestionnaireTypeCreate",
-    "QuestionnaireTypeUpdate",
-    "QuestionnaireTypeResponse",
-    "QuestionnaireTypeList",
-    # Question
-    "QuestionCreate",
-    "QuestionUpdate",
-    "QuestionResponse",
-    "QuestionWithOptionsResponse",
-    # QuestionOption
-    "QuestionOptionConfig",
-    "QuestionOptionsSet",
-    "QuestionOptionResponse",
-    # Respondent
-    "RespondentInline",
-    "RespondentResponse",
-    "RespondentList",
-    # Assessment
-    "AssessmentCreate",
-    "AssessmentCreated",
-    "AssessmentResponse",
-    "AssessmentList",
-    "AssessmentWithRespondent",
-]
+_LAZY_EXPORTS: dict[str, str] = {
+    "AssessmentCreate": "src.schemas.assessment",
+    "AssessmentCreated": "src.schemas.assessment",
+    "AssessmentList": "src.schemas.assessment",
+    "AssessmentResponse": "src.schemas.assessment",
+    "AssessmentWithRespondent": "src.schemas.assessment",
+    "DraftAnswer": "src.schemas.draft",
+    "DraftResponse": "src.schemas.draft",
+    "DraftSaveRequest": "src.schemas.draft",
+    "DraftSaveResponse": "src.schemas.draft",
+    "ErrorDetail": "src.schemas.common",
+    "ErrorResponse": "src.schemas.common",
+    "PaginatedResponse": "src.schemas.common",
+    "PaginationParams": "src.schemas.common",
+    "SuccessResponse": "src.schemas.common",
+    "ValidationErrorResponse": "src.schemas.common",
+    "QuestionCreate": "src.schemas.question",
+    "QuestionResponse": "src.schemas.question",
+    "QuestionUpdate": "src.schemas.question",
+    "QuestionWithOptionsResponse": "src.schemas.question",
+    "QuestionOptionConfig": "src.schemas.question_option",
+    "QuestionOptionResponse": "src.schemas.question_option",
+    "QuestionOptionsSet": "src.schemas.question_option",
+    "YesOptionConfig": "src.schemas.question_option",
+    "NoOptionConfig": "src.schemas.question_option",
+    "QuestionnaireTypeCreate": "src.schemas.questionnaire_type",
+    "QuestionnaireTypeList": "src.schemas.questionnaire_type",
+    "QuestionnaireTypeResponse": "src.schemas.questionnaire_type",
+    "QuestionnaireTypeUpdate": "src.schemas.questionnaire_type",
+    "RespondentInline": "src.schemas.respondent",
+    "OrgRespondentInline": "src.schemas.respondent",
+    "PersonRespondentInline": "src.schemas.respondent",
+    "RespondentList": "src.schemas.respondent",
+    "RespondentResponse": "src.schemas.respondent",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
+
+__all__ = list(_LAZY_EXPORTS)
@@ -0,0 +1,23 @@
+"""Shared constrained string types for request schemas."""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# Non-empty names and labels by maximum length
+NameShort = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+NameMedium = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+NameLong = Annotated[str, StringConstraints(min_length=1, max_length=300)]
+
+RegistrationNo = Annotated[str, StringConstraints(max_length=50)]
+Phone = Annotated[str, StringConstraints(min_length=1, max_length=50)]
+
+# Shape-only email check (local@domain.tld), run by pydantic-core's regex engine
+EmailAddressStr = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        max_length=254,
+        pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$",
+    ),
+]
@@ -23,7 +23,7 @@ class AnswerInput(BaseModel):
 class AnswerResponse(BaseModel):
     """Schema for answer response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     assessment_id: UUID
@@ -48,7 +48,7 @@ class AssessmentCreated(BaseModel):
 class AssessmentResponse(BaseModel):
     """Schema for assessment response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     respondent_id: UUID
@@ -65,7 +65,7 @@ class AssessmentResponse(BaseModel):
 class AssessmentList(BaseModel):
     """Schema for listing assessments (minimal fields)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     respondent_id: UUID
@@ -80,7 +80,7 @@ class AssessmentList(BaseModel):
 class AssessmentWithRespondent(BaseModel):
     """Schema for assessment with respondent details."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     respondent_id: UUID
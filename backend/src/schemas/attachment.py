@@ -18,7 +18,7 @@ class AttachmentUpload(BaseModel):
 class AttachmentResponse(BaseModel):
     """Schema for attachment response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     answer_id: UUID
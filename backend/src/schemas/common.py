@@ -1,8 +1,8 @@
 """Common Pydantic schemas used across the API."""
 
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 T = TypeVar("T")
 
@@ -56,7 +56,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
         Returns:
             PaginatedResponse instance.
         """
-        pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+        # Empty pages skip the division entirely; otherwise ceil via negated floor
+        pages = -(-total // page_size) if total and page_size > 0 else 0
         return cls(
             items=items,
             total=total,
@@ -72,10 +73,16 @@ class PaginationParams(BaseModel):
     page: int = Field(1, ge=1, description="Page number")
     page_size: int = Field(20, ge=1, le=100, description="Items per page")
 
+    _offset: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the query offset once after validation."""
+        self._offset = (self.page - 1) * self.page_size
+
     @property
     def offset(self) -> int:
-        """Calculate offset for database query."""
-        return (self.page - 1) * self.page_size
+        """Get offset for database query."""
+        return self._offset
 
     @property
     def limit(self) -> int:
@@ -50,7 +50,7 @@ class DraftSaveRequest(BaseModel):
 class DraftResponse(BaseModel):
     """Schema for loading draft from server."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     answers: list[DraftAnswer] = Field(
         ...,
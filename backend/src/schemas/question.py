@@ -3,7 +3,11 @@
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Shared weight default and upper bound for Create/Update
+_WEIGHT_DEFAULT = Decimal("1.0")
+_WEIGHT_MAX = Decimal("100.0")
 
 
 class QuestionCreate(BaseModel):
@@ -13,9 +17,9 @@ class QuestionCreate(BaseModel):
     text: str = Field(..., min_length=1, max_length=2000, description="Question text (Mongolian)")
     display_order: int = Field(default=0, ge=0, description="Order within group for display")
     weight: Decimal = Field(
-        default=Decimal("1.0"),
+        default=_WEIGHT_DEFAULT,
         gt=0,
-        le=Decimal("100.0"),
+        le=_WEIGHT_MAX,
         description="Question weight (future use)",
     )
     is_critical: bool = Field(default=False, description="Critical flag (future use)")
@@ -26,7 +30,7 @@ class QuestionUpdate(BaseModel):
 
     text: str | None = Field(None, min_length=1, max_length=2000)
     display_order: int | None = Field(None, ge=0)
-    weight: Decimal | None = Field(None, gt=0, le=Decimal("100.0"))
+    weight: Decimal | None = Field(None, gt=0, le=_WEIGHT_MAX)
     is_critical: bool | None = None
     is_active: bool | None = None
 
@@ -34,7 +38,7 @@ class QuestionUpdate(BaseModel):
 class QuestionResponse(BaseModel):
     """Schema for question response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     group_id: UUID
@@ -45,10 +49,14 @@ class QuestionResponse(BaseModel):
     is_active: bool
 
 
+# Validates a whole page of ORM rows in one core-schema call
+QUESTION_LIST_ADAPTER = TypeAdapter(list[QuestionResponse])
+
+
 class QuestionWithOptionsResponse(BaseModel):
     """Schema for question response including options."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     group_id: UUID
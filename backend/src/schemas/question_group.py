@@ -4,23 +4,25 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from src.schemas._types import NameMedium
 
 
 class QuestionGroupCreate(BaseModel):
     """Schema for creating a question group."""
 
     type_id: UUID = Field(..., description="Parent questionnaire type ID")
-    name: str = Field(..., min_length=1, max_length=200, description="Group name (Mongolian)")
+    name: NameMedium = Field(..., description="Group name (Mongolian)")
     display_order: int = Field(
         default=0,
         ge=0,
         description="Display order within the type",
     )
-    weight: Decimal = Field(
-        default=Decimal("1.0"),
-        gt=0,
-        le=Decimal("100.0"),
+    weight: float = Field(
+        default=1.0,
+        gt=0.0,
+        le=100.0,
         description="Weight for type score calculation",
     )
 
@@ -28,16 +30,16 @@ class QuestionGroupCreate(BaseModel):
 class QuestionGroupUpdate(BaseModel):
     """Schema for updating a question group."""
 
-    name: str | None = Field(None, min_length=1, max_length=200)
+    name: NameMedium | None = None
     display_order: int | None = Field(None, ge=0)
-    weight: Decimal | None = Field(None, gt=0, le=Decimal("100.0"))
+    weight: float | None = Field(None, gt=0.0, le=100.0)
     is_active: bool | None = None
 
 
 class QuestionGroupResponse(BaseModel):
     """Schema for question group response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     type_id: UUID
@@ -49,10 +51,14 @@ class QuestionGroupResponse(BaseModel):
     updated_at: datetime
 
 
+# Validates a whole page of ORM rows in one core-schema call
+QUESTION_GROUP_LIST_ADAPTER = TypeAdapter(list[QuestionGroupResponse])
+
+
 class QuestionGroupList(BaseModel):
     """Schema for listing question groups (minimal fields)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     type_id: UUID
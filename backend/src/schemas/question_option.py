@@ -1,8 +1,9 @@
 """Pydantic schemas for QuestionOption."""
 
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationInfo, field_validator
 
 from src.models.enums import OptionType
 
@@ -23,34 +24,44 @@ class QuestionOptionConfig(BaseModel):
     max_images: int = Field(default=3, ge=1, le=10, description="Maximum images allowed")
     image_max_mb: int = Field(default=5, ge=1, le=20, description="Maximum image size in MB")
 
-    @model_validator(mode="after")
-    def validate_comment_requirement(self) -> "QuestionOptionConfig":
-        """Ensure comment_min_len is set only if comment is required."""
-        if self.comment_min_len > 0 and not self.require_comment:
+    @field_validator("comment_min_len")
+    @classmethod
+    def validate_comment_requirement(cls, v: int, info: ValidationInfo) -> int:
+        """Ensure comment_min_len is set only if comment is required.
+
+        require_comment is declared earlier, so it is in info.data unless it
+        failed its own validation; that error is reported on its own then.
+        """
+        if "require_comment" not in info.data:
+            return v
+        if v > 0 and not info.data["require_comment"]:
             raise ValueError("comment_min_len can only be set if require_comment is true")
-        return self
+        return v
+
+
+class YesOptionConfig(QuestionOptionConfig):
+    """Option configuration restricted to option_type=YES."""
+
+    option_type: Literal[OptionType.YES] = Field(..., description="Must be YES")
+
+
+class NoOptionConfig(QuestionOptionConfig):
+    """Option configuration restricted to option_type=NO."""
+
+    option_type: Literal[OptionType.NO] = Field(..., description="Must be NO")
 
 
 class QuestionOptionsSet(BaseModel):
     """Schema for setting both YES and NO options for a question."""
 
-    yes: QuestionOptionConfig = Field(..., description="Configuration for YES option")
-    no: QuestionOptionConfig = Field(..., description="Configuration for NO option")
-
-    @model_validator(mode="after")
-    def validate_option_types(self) -> "QuestionOptionsSet":
-        """Ensure option types are correct."""
-        if self.yes.option_type != OptionType.YES:
-            raise ValueError("yes option must have option_type=YES")
-        if self.no.option_type != OptionType.NO:
-            raise ValueError("no option must have option_type=NO")
-        return self
+    yes: YesOptionConfig = Field(..., description="Configuration for YES option")
+    no: NoOptionConfig = Field(..., description="Configuration for NO option")
 
 
 class QuestionOptionResponse(BaseModel):
     """Schema for question option response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     question_id: UUID
@@ -61,3 +72,7 @@ class QuestionOptionResponse(BaseModel):
     comment_min_len: int
     max_images: int
     image_max_mb: int
+
+
+# Validates a list of ORM rows in one core-schema call
+QUESTION_OPTION_LIST_ADAPTER = TypeAdapter(list[QuestionOptionResponse])
@@ -4,15 +4,16 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from src.models.enums import ScoringMethod
+from src.schemas._types import NameMedium
 
 
 class QuestionnaireTypeCreate(BaseModel):
     """Schema for creating a questionnaire type."""
 
-    name: str = Field(..., min_length=1, max_length=200, description="Type name (Mongolian)")
+    name: NameMedium = Field(..., description="Type name (Mongolian)")
     scoring_method: ScoringMethod = Field(
         default=ScoringMethod.SUM,
         description="Score calculation method",
@@ -29,10 +30,10 @@ class QuestionnaireTypeCreate(BaseModel):
         le=100,
         description="Percentage threshold for MEDIUM risk (>= this = medium)",
     )
-    weight: Decimal = Field(
-        default=Decimal("1.0"),
-        gt=0,
-        le=Decimal("100.0"),
+    weight: float = Field(
+        default=1.0,
+        gt=0.0,
+        le=100.0,
         description="Weight for overall score calculation",
     )
 
@@ -40,18 +41,18 @@ class QuestionnaireTypeCreate(BaseModel):
 class QuestionnaireTypeUpdate(BaseModel):
     """Schema for updating a questionnaire type."""
 
-    name: str | None = Field(None, min_length=1, max_length=200)
+    name: NameMedium | None = None
     scoring_method: ScoringMethod | None = None
     threshold_high: int | None = Field(None, ge=0, le=100)
     threshold_medium: int | None = Field(None, ge=0, le=100)
-    weight: Decimal | None = Field(None, gt=0, le=Decimal("100.0"))
+    weight: float | None = Field(None, gt=0.0, le=100.0)
     is_active: bool | None = None
 
 
 class QuestionnaireTypeResponse(BaseModel):
     """Schema for questionnaire type response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     name: str
@@ -64,10 +65,14 @@ class QuestionnaireTypeResponse(BaseModel):
     updated_at: datetime
 
 
+# Validates a whole page of ORM rows in one core-schema call
+QUESTIONNAIRE_TYPE_LIST_ADAPTER = TypeAdapter(list[QuestionnaireTypeResponse])
+
+
 class QuestionnaireTypeList(BaseModel):
     """Schema for listing questionnaire types (minimal fields)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     name: str
@@ -1,36 +1,52 @@
 """Pydantic schemas for Respondent."""
 
 from datetime import datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field
 
 from src.models.enums import RespondentKind
+from src.schemas._types import NameLong, RegistrationNo
 
 
-class RespondentInline(BaseModel):
-    """Inline respondent data provided from Odoo during assessment creation."""
+class _RespondentInlineBase(BaseModel):
+    """Fields shared by every inline respondent kind."""
 
     odoo_id: str = Field(..., max_length=100, description="Unique respondent ID from Odoo")
-    name: str = Field(..., min_length=1, max_length=300, description="Respondent name")
-    kind: RespondentKind = Field(..., description="ORG or PERSON")
-    registration_no: str | None = Field(
-        None,
-        max_length=50,
-        description="Required for ORG, optional for PERSON",
+    name: NameLong = Field(..., description="Respondent name")
+
+
+class OrgRespondentInline(_RespondentInlineBase):
+    """Inline organization respondent; registration_no is required."""
+
+    kind: Literal[RespondentKind.ORG] = Field(..., description="ORG")
+    registration_no: RegistrationNo = Field(
+        ...,
+        min_length=1,
+        description="Organization registration number",
     )
 
-    @model_validator(mode="after")
-    def validate_registration_no(self) -> "RespondentInline":
-        if self.kind == RespondentKind.ORG and not self.registration_no:
-            raise ValueError("registration_no is required for ORG respondents")
-        return self
+
+class PersonRespondentInline(_RespondentInlineBase):
+    """Inline person respondent; registration_no is optional."""
+
+    kind: Literal[RespondentKind.PERSON] = Field(..., description="PERSON")
+    registration_no: RegistrationNo | None = Field(None, description="Optional registration number")
+
+
+# Inline respondent data provided from Odoo during assessment creation,
+# dispatched on ``kind``
+RespondentInline = Annotated[
+    OrgRespondentInline | PersonRespondentInline,
+    Discriminator("kind"),
+]
 
 
 class RespondentResponse(BaseModel):
     """Schema for respondent response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     kind: RespondentKind
@@ -44,7 +60,7 @@ class RespondentResponse(BaseModel):
 class RespondentList(BaseModel):
     """Schema for listing respondents (minimal fields)."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     kind: RespondentKind
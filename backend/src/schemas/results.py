@@ -11,6 +11,8 @@ from src.models.enums import OptionType, RiskRating
 class GroupScore(BaseModel):
     """Schema for per-group score result within a type."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     group_id: UUID = Field(..., description="Question group ID")
     group_name: str = Field(..., description="Question group name")
     raw_score: int = Field(..., ge=0, description="Total points awarded")
@@ -24,6 +26,8 @@ class GroupScore(BaseModel):
 class TypeScore(BaseModel):
     """Schema for per-type score result."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type_id: UUID = Field(..., description="Questionnaire type ID")
     type_name: str = Field(..., description="Questionnaire type name")
     raw_score: int = Field(..., ge=0, description="Total points awarded")
@@ -44,6 +48,8 @@ class TypeScore(BaseModel):
 class OverallScore(BaseModel):
     """Schema for overall assessment score."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     raw_score: int = Field(..., ge=0, description="Total points awarded")
     max_score: int = Field(..., ge=0, description="Maximum possible points")
     percentage: float = Field(..., ge=0, le=100, description="Score percentage")
@@ -57,6 +63,8 @@ class OverallScore(BaseModel):
 class AnswerBreakdown(BaseModel):
     """Schema for individual answer in breakdown."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     question_id: UUID = Field(..., description="Question ID from snapshot")
     question_text: str = Field(..., description="Question text from snapshot")
     type_id: UUID = Field(..., description="Questionnaire type ID")
@@ -71,7 +79,7 @@ class AnswerBreakdown(BaseModel):
 class SubmissionContactInfo(BaseModel):
     """Schema for submission contact info in results."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     last_name: str = Field(..., description="Овог (Family name)")
     first_name: str = Field(..., description="Нэр (Given name)")
@@ -83,7 +91,7 @@ class SubmissionContactInfo(BaseModel):
 class AssessmentResultsResponse(BaseModel):
     """Schema for complete assessment results."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     assessment_id: UUID = Field(..., description="Assessment ID")
     respondent_id: UUID = Field(..., description="Respondent ID")
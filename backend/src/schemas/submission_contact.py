@@ -3,46 +3,29 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.schemas._types import EmailAddressStr, NameMedium, NameShort, Phone
 
 
 class SubmissionContactInput(BaseModel):
     """Schema for submission contact input (embedded in submit request)."""
 
-    last_name: str = Field(
-        ...,
-        min_length=1,
-        max_length=100,
-        description="Овог (Family name)",
-    )
-    first_name: str = Field(
-        ...,
-        min_length=1,
-        max_length=100,
-        description="Нэр (Given name)",
-    )
-    email: EmailStr = Field(
+    last_name: NameShort = Field(..., description="Овог (Family name)")
+    first_name: NameShort = Field(..., description="Нэр (Given name)")
+    email: EmailAddressStr = Field(
         ...,
         description="Email address",
+        json_schema_extra={"format": "email"},
     )
-    phone: str = Field(
-        ...,
-        min_length=1,
-        max_length=50,
-        description="Phone number",
-    )
-    position: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        description="Албан тушаал (Job position)",
-    )
+    phone: Phone = Field(..., description="Phone number")
+    position: NameMedium = Field(..., description="Албан тушаал (Job position)")
 
 
 class SubmissionContactResponse(BaseModel):
     """Schema for submission contact response."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
 
     id: UUID
     assessment_id: UUID
@@ -5,12 +5,15 @@ Run with: python -m src.seeds.questions_seed
 
 import asyncio
 import logging
+import re
 from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from uuid import uuid4
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import Insert, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import async_session_factory
@@ -34,7 +37,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedQuestion:
     """A single question with parsed option and score.
 
@@ -49,7 +52,7 @@ class ParsedQuestion:
     score: int  # 0 or 1
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedGroup:
     """A group of questions with a name.
 
@@ -62,7 +65,7 @@ class ParsedGroup:
     questions: list[ParsedQuestion] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedType:
     """A questionnaire type containing multiple groups.
 
@@ -75,7 +78,7 @@ class ParsedType:
     groups: list[ParsedGroup] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedQuestionData:
     """Complete parsed data from one markdown file.
 
@@ -86,7 +89,7 @@ class ParsedQuestionData:
     types: list[ParsedType] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SeedStats:
     """Summary statistics from seed operation.
 
@@ -105,10 +108,59 @@ class SeedStats:
     errors: int = 0
 
 
+@dataclass(slots=True)
+class ExistingRows:
+    """Rows already in the database, prefetched once per seed run.
+
+    Attributes:
+        types: Type name -> type ID.
+        groups: (type_id, group name) -> (group ID, display_order).
+        questions: group_id -> {question text -> (question ID, display_order)}.
+    """
+
+    types: dict[str, UUID] = field(default_factory=dict)
+    groups: dict[tuple[UUID, str], tuple[UUID, int]] = field(default_factory=dict)
+    questions: dict[UUID, dict[str, tuple[UUID, int]]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class PendingRows:
+    """Rows collected for one file, written with one statement per table.
+
+    Attributes:
+        types: New questionnaire type rows.
+        groups: New question group rows.
+        questions: New question rows.
+        options: (question_id, option type) -> option row to upsert.
+        group_orders: Existing group ID -> new display_order.
+        question_orders: Existing question ID -> new display_order.
+    """
+
+    types: list[dict[str, Any]] = field(default_factory=list)
+    groups: list[dict[str, Any]] = field(default_factory=list)
+    questions: list[dict[str, Any]] = field(default_factory=list)
+    options: dict[tuple[UUID, OptionType], dict[str, Any]] = field(default_factory=dict)
+    group_orders: dict[UUID, int] = field(default_factory=dict)
+    question_orders: dict[UUID, int] = field(default_factory=dict)
+
+
 # =============================================================================
 # Inverse Scoring Logic
 # =============================================================================
 
+# Accepted option labels and scores in the markdown source
+_VALID_OPTIONS = frozenset(("Үгүй", "Тийм"))
+_VALID_SCORES = frozenset((0, 1))
+
+# Well-formed question line (after lstrip): text, tab(s), option, optional tab(s) + 0/1
+_QUESTION_LINE_RE = re.compile(r"([^\t]+)\t\s*(Үгүй|Тийм)(?:\s*\t\s*([01]))?\s*")
+
+# (option_text, score) -> (no_score, yes_score); any other pair scores (0, 0)
+_SCORE_TABLE: dict[tuple[str, int], tuple[int, int]] = {
+    ("Үгүй", 1): (1, 0),
+    ("Тийм", 1): (0, 1),
+}
+
 
 def calculate_scores(option_text: str, score: int) -> tuple[int, int]:
     """Calculate NO and YES scores based on parsed option.
@@ -131,13 +183,8 @@ def calculate_scores(option_text: str, score: int) -> tuple[int, int]:
         >>> calculate_scores("Үгүй", 0)
         (0, 0)
     """
-    if option_text == "Үгүй" and score == 1:
-        return (1, 0)
-    elif option_text == "Тийм" and score == 1:
-        return (0, 1)
-    else:
-        # Both can be 0
-        return (0, 0)
+    # Both can be 0
+    return _SCORE_TABLE.get((option_text, score), (0, 0))
 
 
 # =============================================================================
@@ -165,17 +212,22 @@ def parse_question_line(
         # Strip leading whitespace (spaces/tabs) first
         content = line.lstrip()
 
-        # Split by tab
-        parts = content.split('\t')
+        # Fast path: one regex scan covers well-formed lines
+        match = _QUESTION_LINE_RE.fullmatch(content)
+        if match is not None:
+            text, option_text, score_str = match.groups()
+            return (text.rstrip(), option_text, int(score_str) if score_str else 0)
 
-        # Clean up each part (strip whitespace)
-        parts = [p.strip() for p in parts if p.strip()]
+        # Split by tab and clean up each part (strip whitespace)
+        parts = [p.strip() for p in content.split('\t') if p.strip()]
 
         if len(parts) < 2:
             # Not enough parts even for text + option
             logger.warning(
-                f"{file_path}:{line_number}: Warning: Question line missing parts, "
-                f"skipping: '{content[:80]}'"
+                "%s:%d: Warning: Question line missing parts, skipping: '%.80s'",
+                file_path,
+                line_number,
+                content,
             )
             return None
 
@@ -188,10 +240,13 @@ def parse_question_line(
             text, option_text, score_str = parts[0], parts[1], parts[2]
 
         # Validate option text first (before trying to parse score)
-        if option_text not in ("Үгүй", "Тийм"):
+        if option_text not in _VALID_OPTIONS:
             logger.warning(
-                f"{file_path}:{line_number}: Warning: Invalid option '{option_text}', "
-                f"skipping question: '{text[:50]}'"
+                "%s:%d: Warning: Invalid option '%s', skipping question: '%.50s'",
+                file_path,
+                line_number,
+                option_text,
+                text,
             )
             return None
 
@@ -201,16 +256,22 @@ def parse_question_line(
         else:
             try:
                 score = int(score_str.strip())
-                if score not in (0, 1):
+                if score not in _VALID_SCORES:
                     logger.warning(
-                        f"{file_path}:{line_number}: Warning: Invalid score '{score_str}', "
-                        f"using default 0: '{text[:50]}'"
+                        "%s:%d: Warning: Invalid score '%s', using default 0: '%.50s'",
+                        file_path,
+                        line_number,
+                        score_str,
+                        text,
                     )
                     score = 0
             except ValueError:
                 logger.warning(
-                    f"{file_path}:{line_number}: Warning: Score not an integer '{score_str}', "
-                    f"using default 0: '{text[:50]}'"
+                    "%s:%d: Warning: Score not an integer '%s', using default 0: '%.50s'",
+                    file_path,
+                    line_number,
+                    score_str,
+                    text,
                 )
                 score = 0
 
@@ -218,7 +279,7 @@ def parse_question_line(
 
     except Exception as e:
         logger.warning(
-            f"{file_path}:{line_number}: Warning: Failed to parse question line: {e}"
+            "%s:%d: Warning: Failed to parse question line: %s", file_path, line_number, e
         )
         return None
 
@@ -261,90 +322,119 @@ def parse_markdown_file(file_path: Path) -> ParsedQuestionData:
     current_type = ParsedType(name=type_name)
     result = ParsedQuestionData(types=[current_type])
     current_group: ParsedGroup | None = None
+    # Converted once; passed to parse_question_line for every question line
+    file_path_str = str(file_path)
+    # Bound once for the inlined question fast path in the loop
+    match_question_line = _QUESTION_LINE_RE.fullmatch
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line_number, line in enumerate(f, start=1):
-                # Skip empty lines and comments
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
+        # One strict UTF-8 decode of the raw bytes. Only \n, \r\n and \r end
+        # a line, as with text-mode file iteration; splitlines() would also
+        # break on \x0b, \x0c, \x1c-\x1e, \x85, \u2028 and \u2029
+        text = file_path.read_bytes().decode("utf-8")
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        for line_number, line in enumerate(text.split("\n"), start=1):
+            # Skip empty lines and comments, reusing the indent lstrip below;
+            # only lines starting with other whitespace need a full strip
+            stripped_left = line.lstrip(' \t')
+            if not stripped_left or stripped_left[0] == '#':
+                continue
+            if stripped_left[0].isspace():
+                first = stripped_left.strip()[:1]
+                if not first or first == '#':
                     continue
 
-                # Count leading spaces and tabs character by character
-                leading_spaces = 0
-                leading_tabs = 0
-                for char in line:
-                    if char == ' ':
-                        leading_spaces += 1
-                    elif char == '\t':
-                        leading_tabs += 1
-                    else:
-                        break
-
-                # Check if line contains tabs (used as separators between parts)
-                has_tabs = '\t' in line
-
-                # Group header (0 leading spaces, NO leading tabs)
-                # Groups have no indentation at all, but may have trailing tabs.
-                # Key difference from question lines: group headers DON'T end with Үгүй/Тийм option.
-                if leading_spaces == 0 and leading_tabs == 0:
-                    # Check if this looks like a question line (ends with Үгүй or Тийм option)
-                    # Split by tabs and check the last non-empty part
-                    parts = [p.strip() for p in line.split('\t') if p.strip()]
-                    last_part = parts[-1] if parts else ""
-                    is_question_line = last_part in ("Үгүй", "Тийм")
-
-                    if not is_question_line:
-                        # This is a group header (with or without trailing tabs)
-                        # Remove trailing tabs, colon, and whitespace
-                        group_name = stripped.rstrip(":\t").strip()
-                        current_group = ParsedGroup(name=group_name)
-                        current_type.groups.append(current_group)
-                    else:
-                        # This is a question line with no indentation
-                        # Treat it as a question if we have a group
-                        if current_group is not None:
-                            parsed = parse_question_line(line, str(file_path), line_number)
-                            if parsed:
-                                text, option_text, score = parsed
-                                text = text.strip()
-                                question = ParsedQuestion(
-                                    text=text, option_text=option_text, score=score
-                                )
-                                current_group.questions.append(question)
-                        else:
-                            logger.warning(
-                                f"{file_path}:{line_number}: Warning: Question without "
-                                f"group, skipping: '{stripped[:50]}'"
+            # Count leading spaces and tabs with C-level string methods
+            leading = len(line) - len(stripped_left)
+            leading_spaces = line.count(' ', 0, leading)
+            leading_tabs = leading - leading_spaces
+
+            # Check if line contains tabs (used as separators between parts)
+            has_tabs = leading_tabs > 0 or '\t' in stripped_left
+
+            # Group header (0 leading spaces, NO leading tabs)
+            # Groups have no indentation at all, but may have trailing tabs.
+            # Key difference from question lines: group headers DON'T end with Үгүй/Тийм option.
+            if leading_spaces == 0 and leading_tabs == 0:
+                # Check if this looks like a question line (ends with Үгүй or Тийм option)
+                # Only the last non-empty tab-separated part matters, so peel it off
+                last_part = line.rstrip().rsplit('\t', 1)[-1].strip()
+                is_question_line = last_part in _VALID_OPTIONS
+
+                if not is_question_line:
+                    # This is a group header (with or without trailing tabs)
+                    # Remove trailing tabs, colon, and whitespace
+                    group_name = line.strip().rstrip(":\t").strip()
+                    current_group = ParsedGroup(name=group_name)
+                    current_type.groups.append(current_group)
+                else:
+                    # This is a question line with no indentation
+                    # Treat it as a question if we have a group
+                    if current_group is not None:
+                        parsed = parse_question_line(line, file_path_str, line_number)
+                        if parsed:
+                            text, option_text, score = parsed
+                            text = text.strip()
+                            question = ParsedQuestion(
+                                text=text, option_text=option_text, score=score
                             )
-
-                # Question line (5-7 leading spaces OR leading tabs AND has tabs for separators)
-                # Format: "       Question text\t\tOption\t\tScore" (5-7 spaces + tabs)
-                # OR: "\tQuestion text\t\tOption\t\tScore" (tab + tabs)
-                elif (leading_spaces >= 5 or leading_tabs > 0) and has_tabs:
-                    if current_group is None:
+                            current_group.questions.append(question)
+                    else:
                         logger.warning(
-                            f"{file_path}:{line_number}: Warning: Question without "
-                            f"group, skipping: '{stripped[:50]}'"
+                            "%s:%d: Warning: Question without group, skipping: '%.50s'",
+                            file_path,
+                            line_number,
+                            line.strip(),
                         )
-                        continue
 
-                    parsed = parse_question_line(line, str(file_path), line_number)
-                    if parsed:
-                        text, option_text, score = parsed
-                        # Strip leading whitespace from question text
-                        text = text.strip()
+            # Question line (5-7 leading spaces OR leading tabs AND has tabs for separators)
+            # Format: "       Question text\t\tOption\t\tScore" (5-7 spaces + tabs)
+            # OR: "\tQuestion text\t\tOption\t\tScore" (tab + tabs)
+            elif (leading_spaces >= 5 or leading_tabs > 0) and has_tabs:
+                if current_group is None:
+                    logger.warning(
+                        "%s:%d: Warning: Question without group, skipping: '%.50s'",
+                        file_path,
+                        line_number,
+                        line.strip(),
+                    )
+                    continue
+
+                # Fast path: match well-formed lines in place; a non-empty text
+                # means parse_question_line would return the same values
+                match = match_question_line(stripped_left)
+                if match is not None:
+                    text, option_text, score_str = match.groups()
+                    text = text.strip()
+                    if text:
                         question = ParsedQuestion(
-                            text=text, option_text=option_text, score=score
+                            text=text,
+                            option_text=option_text,
+                            score=int(score_str) if score_str else 0,
                         )
                         current_group.questions.append(question)
+                        continue
 
-                # Skip other lines
-                else:
-                    logger.debug(
-                        f"{file_path}:{line_number}: Skipping line (spaces={leading_spaces}, "
-                        f"tabs={leading_tabs}): '{stripped[:50]}'"
+                parsed = parse_question_line(line, file_path_str, line_number)
+                if parsed:
+                    text, option_text, score = parsed
+                    # Strip leading whitespace from question text
+                    text = text.strip()
+                    question = ParsedQuestion(
+                        text=text, option_text=option_text, score=score
                     )
+                    current_group.questions.append(question)
+
+            # Skip other lines; build the debug record only when it will be emitted
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s:%d: Skipping line (spaces=%d, tabs=%d): '%.50s'",
+                    file_path,
+                    line_number,
+                    leading_spaces,
+                    leading_tabs,
+                    line.strip(),
+                )
 
     except UnicodeDecodeError as e:
         raise UnicodeDecodeError(
@@ -367,6 +457,22 @@ def parse_markdown_file(file_path: Path) -> ParsedQuestionData:
 # Database Helper Functions
 # =============================================================================
 
+# Default weight for seeded rows; Decimal is immutable, so one instance is shared
+_WEIGHT_ONE = Decimal("1.0")
+
+# Column values for newly seeded types and groups
+_NEW_TYPE_DEFAULTS = {
+    "scoring_method": ScoringMethod.SUM,
+    "threshold_high": 80,
+    "threshold_medium": 50,
+    "weight": _WEIGHT_ONE,
+    "is_active": True,
+}
+_NEW_GROUP_DEFAULTS = {
+    "weight": _WEIGHT_ONE,
+    "is_active": True,
+}
+
 
 async def create_questionnaire_type(
     session: AsyncSession, name: str
@@ -392,18 +498,28 @@ async def create_questionnaire_type(
         return existing
 
     # Create new
-    qtype = QuestionnaireType(
-        id=uuid4(),
-        name=name,
-        scoring_method=ScoringMethod.SUM,
-        threshold_high=80,
-        threshold_medium=50,
-        weight=Decimal("1.0"),
-        is_active=True,
-    )
-    session.add(qtype)
-    await session.flush()
-    return qtype
+    type_id = await insert_questionnaire_type(session, name)
+    return await session.get(QuestionnaireType, type_id)
+
+
+def _type_row(name: str) -> dict[str, Any]:
+    """Build the column values for a new questionnaire type."""
+    return {"id": uuid4(), "name": name, **_NEW_TYPE_DEFAULTS}
+
+
+async def insert_questionnaire_type(session: AsyncSession, name: str) -> UUID:
+    """Insert a new questionnaire type without loading an ORM instance.
+
+    Args:
+        session: Async SQLAlchemy session.
+        name: Type name in Mongolian Cyrillic.
+
+    Returns:
+        ID of the inserted type.
+    """
+    row = _type_row(name)
+    await session.execute(pg_insert(QuestionnaireType).values(row))
+    return row["id"]
 
 
 async def create_question_group(
@@ -435,17 +551,89 @@ async def create_question_group(
         return existing
 
     # Create new
-    group = QuestionGroup(
-        id=uuid4(),
-        type_id=type_id,
-        name=name,
-        display_order=order,
-        weight=Decimal("1.0"),
-        is_active=True,
+    group_id = await insert_question_group(session, type_id, name, order)
+    return await session.get(QuestionGroup, group_id)
+
+
+def _group_row(type_id: UUID, name: str, order: int) -> dict[str, Any]:
+    """Build the column values for a new question group."""
+    return {
+        "id": uuid4(),
+        "type_id": type_id,
+        "name": name,
+        "display_order": order,
+        **_NEW_GROUP_DEFAULTS,
+    }
+
+
+async def insert_question_group(
+    session: AsyncSession, type_id: UUID, name: str, order: int
+) -> UUID:
+    """Insert a new question group without loading an ORM instance.
+
+    Args:
+        session: Async SQLAlchemy session.
+        type_id: Parent questionnaire type ID.
+        name: Group name in Mongolian Cyrillic.
+        order: Display order within type (1, 2, 3...).
+
+    Returns:
+        ID of the inserted group.
+    """
+    row = _group_row(type_id, name, order)
+    await session.execute(pg_insert(QuestionGroup).values(row))
+    return row["id"]
+
+
+def _question_row(group_id: UUID, text: str, order: int) -> dict[str, Any]:
+    """Build the column values for a new question."""
+    return {
+        "id": uuid4(),
+        "group_id": group_id,
+        "text": text,
+        "display_order": order,
+        "weight": _WEIGHT_ONE,
+        "is_critical": False,
+        "is_active": True,
+    }
+
+
+def _option_row(question_id: UUID, option_type: OptionType, score: int) -> dict[str, Any]:
+    """Build the column values for a seeded question option."""
+    # Note: max_images=1 due to database constraint ck_max_images_range
+    return {
+        "question_id": question_id,
+        "option_type": option_type,
+        "score": score,
+        "require_comment": False,
+        "require_image": False,
+        "comment_min_len": 0,
+        "max_images": 1,
+        "image_max_mb": 1,
+    }
+
+
+def _refresh_option_score(stmt: Insert) -> Insert:
+    """Make an option INSERT refresh the score of options that already exist."""
+    return stmt.on_conflict_do_update(
+        constraint="uq_question_option_type",
+        set_={"score": stmt.excluded.score},
     )
-    session.add(group)
-    await session.flush()
-    return group
+
+
+async def upsert_question_options(
+    session: AsyncSession, rows: list[dict[str, Any]]
+) -> None:
+    """Insert question options, refreshing the score of ones that already exist.
+
+    Runs as a single statement via ON CONFLICT on uq_question_option_type;
+    existing options keep their other settings.
+
+    Args:
+        session: Async SQLAlchemy session.
+        rows: Option rows from _option_row, at most one per (question, type).
+    """
+    await session.execute(_refresh_option_score(pg_insert(QuestionOption)), rows)
 
 
 async def create_question(
@@ -470,7 +658,7 @@ async def create_question(
         Created or updated Question instance.
     """
     # Validate scores
-    if no_score not in (0, 1) or yes_score not in (0, 1):
+    if no_score not in _VALID_SCORES or yes_score not in _VALID_SCORES:
         raise ValueError(
             f"Invalid scores: no_score={no_score}, yes_score={yes_score} "
             f"(must be 0 or 1)"
@@ -478,75 +666,172 @@ async def create_question(
 
     # Check if exists by (group_id, text)
     result = await session.execute(
-        select(Question).where(Question.group_id == group_id, Question.text == text)
+        select(Question.id, Question.display_order).where(
+            Question.group_id == group_id, Question.text == text
+        )
     )
-    existing = result.scalar_one_or_none()
+    existing = result.one_or_none()
 
     if existing:
+        question_id, current_order = existing
         # Update display_order if changed
-        if existing.display_order != order:
-            existing.display_order = order
-        question_id = existing.id
+        if current_order != order:
+            await session.execute(
+                update(Question).where(Question.id == question_id).values(display_order=order)
+            )
     else:
         # Create new question
-        question = Question(
-            id=uuid4(),
-            group_id=group_id,
-            text=text,
-            display_order=order,
-            weight=Decimal("1.0"),
-            is_critical=False,
-            is_active=True,
-        )
-        session.add(question)
-        await session.flush()
-        question_id = question.id
+        row = _question_row(group_id, text, order)
+        await session.execute(pg_insert(Question).values(row))
+        question_id = row["id"]
 
-    # Delete existing options (will recreate)
+    # Create both options, or refresh their scores, with one multi-row VALUES
     await session.execute(
-        select(QuestionOption).where(QuestionOption.question_id == question_id)
-    )
-    # Note: We're not actually deleting here, just querying.
-    # In production, we'd do a proper delete or update.
-
-    # Check if options already exist and update/create
-    for option_type, score in [
-        (OptionType.NO, no_score),
-        (OptionType.YES, yes_score),
-    ]:
-        result = await session.execute(
-            select(QuestionOption).where(
-                QuestionOption.question_id == question_id,
-                QuestionOption.option_type == option_type,
+        _refresh_option_score(
+            pg_insert(QuestionOption).values(
+                [
+                    _option_row(question_id, OptionType.NO, no_score),
+                    _option_row(question_id, OptionType.YES, yes_score),
+                ]
             )
         )
-        existing_option = result.scalar_one_or_none()
+    )
+
+    # Return the question (existing or new)
+    result = await session.execute(select(Question).where(Question.id == question_id))
+    return result.scalar_one()
+
+
+async def load_existing_rows(session: AsyncSession) -> ExistingRows:
+    """Prefetch existing types, groups, and questions in three queries.
+
+    Args:
+        session: Async SQLAlchemy session.
+
+    Returns:
+        ExistingRows lookups used to decide insert vs update locally.
+    """
+    existing = ExistingRows()
+
+    result = await session.execute(select(QuestionnaireType.id, QuestionnaireType.name))
+    existing.types = {name: type_id for type_id, name in result}
+
+    result = await session.execute(
+        select(
+            QuestionGroup.id,
+            QuestionGroup.type_id,
+            QuestionGroup.name,
+            QuestionGroup.display_order,
+        )
+    )
+    existing.groups = {
+        (type_id, name): (group_id, order) for group_id, type_id, name, order in result
+    }
+
+    result = await session.execute(
+        select(Question.id, Question.group_id, Question.text, Question.display_order)
+    )
+    for question_id, group_id, text, order in result:
+        existing.questions.setdefault(group_id, {})[text] = (question_id, order)
+
+    return existing
+
 
-        if existing_option:
-            # Update score if changed
-            if existing_option.score != score:
-                existing_option.score = score
+def plan_group_questions(
+    rows: PendingRows,
+    group_id: UUID,
+    questions: list[tuple[str, int, int]],
+    existing: dict[str, tuple[UUID, int]],
+) -> None:
+    """Collect the rows that create or update a group's questions and options.
+
+    Nothing is written; ``existing`` is updated to the state the group will
+    have once ``rows`` has been written with write_pending_rows.
+
+    Args:
+        rows: Pending rows to add to.
+        group_id: Parent question group ID.
+        questions: (text, no_score, yes_score) tuples in display order.
+        existing: Question text -> (ID, display_order) for this group.
+
+    Raises:
+        ValueError: If any score is not 0 or 1 (before anything is collected).
+    """
+    for text, no_score, yes_score in questions:
+        if no_score not in _VALID_SCORES or yes_score not in _VALID_SCORES:
+            raise ValueError(
+                f"Invalid scores for '{text[:50]}': no_score={no_score}, "
+                f"yes_score={yes_score} (must be 0 or 1)"
+            )
+
+    new_rows: dict[str, dict[str, Any]] = {}
+
+    for order, (text, no_score, yes_score) in enumerate(questions, start=1):
+        if text in new_rows:
+            # Repeated text within the file: later occurrence wins, as before
+            row = new_rows[text]
+            row["display_order"] = order
+            question_id = row["id"]
+        elif text in existing:
+            question_id, current_order = existing[text]
+            if current_order != order:
+                rows.question_orders[question_id] = order
+                existing[text] = (question_id, order)
         else:
-            # Create new option
-            # Note: max_images=1 due to database constraint ck_max_images_range
-            new_option = QuestionOption(
-                id=uuid4(),
-                question_id=question_id,
-                option_type=option_type,
-                score=score,
-                require_comment=False,
-                require_image=False,
-                comment_min_len=0,
-                max_images=1,  # Minimum allowed by constraint
-                image_max_mb=1,
+            row = _question_row(group_id, text, order)
+            new_rows[text] = row
+            question_id = row["id"]
+
+        for option_type, score in ((OptionType.NO, no_score), (OptionType.YES, yes_score)):
+            rows.options[(question_id, option_type)] = _option_row(
+                question_id, option_type, score
             )
-            session.add(new_option)
 
-    await session.flush()
+    for text, row in new_rows.items():
+        existing[text] = (row["id"], row["display_order"])
+    rows.questions.extend(new_rows.values())
 
-    # Return the question (existing or new)
-    result = await session.execute(select(Question).where(Question.id == question_id))
-    return result.scalar_one()
+
+async def write_pending_rows(session: AsyncSession, rows: PendingRows) -> None:
+    """Write collected rows with at most one statement per table and action.
+
+    Inserts run parents first (types, groups, questions) so foreign keys
+    resolve; display order changes use ORM bulk UPDATE by primary key and
+    options go through upsert_question_options.
+
+    Args:
+        session: Async SQLAlchemy session.
+        rows: Rows collected by the seed loop and plan_group_questions.
+    """
+    if rows.types:
+        await session.execute(pg_insert(QuestionnaireType), rows.types)
+
+    if rows.groups:
+        await session.execute(pg_insert(QuestionGroup), rows.groups)
+
+    if rows.group_orders:
+        await session.execute(
+            update(QuestionGroup),
+            [
+                {"id": group_id, "display_order": order}
+                for group_id, order in rows.group_orders.items()
+            ],
+        )
+
+    if rows.questions:
+        await session.execute(pg_insert(Question), rows.questions)
+
+    if rows.question_orders:
+        await session.execute(
+            update(Question),
+            [
+                {"id": question_id, "display_order": order}
+                for question_id, order in rows.question_orders.items()
+            ],
+        )
+
+    if rows.options:
+        await upsert_question_options(session, list(rows.options.values()))
 
 
 # =============================================================================
@@ -590,6 +875,9 @@ async def seed_questions(session: AsyncSession) -> SeedStats:
 
     logger.info(f"Found {len(md_files)} markdown file(s) in {questions_dir}/")
 
+    # One pass over existing rows instead of a SELECT per type/group/question
+    existing = await load_existing_rows(session)
+
     # Process each file
     for md_file in md_files:
         try:
@@ -598,41 +886,57 @@ async def seed_questions(session: AsyncSession) -> SeedStats:
             # Parse file
             parsed_data = parse_markdown_file(md_file)
 
-            # Create types, groups, questions
+            # Collect the file's types, groups, questions and options
+            rows = PendingRows()
             for parsed_type in parsed_data.types:
-                qtype = await create_questionnaire_type(session, parsed_type.name)
+                type_id = existing.types.get(parsed_type.name)
+                if type_id is None:
+                    type_row = _type_row(parsed_type.name)
+                    rows.types.append(type_row)
+                    type_id = type_row["id"]
+                    existing.types[parsed_type.name] = type_id
                 stats.types_created += 1
-                logger.info(f"  Type: {qtype.name}")
+                logger.info(f"  Type: {parsed_type.name}")
 
                 for group_order, parsed_group in enumerate(parsed_type.groups, start=1):
-                    group = await create_question_group(
-                        session, qtype.id, parsed_group.name, group_order
-                    )
+                    group_key = (type_id, parsed_group.name)
+                    found = existing.groups.get(group_key)
+                    if found is None:
+                        group_row = _group_row(type_id, parsed_group.name, group_order)
+                        rows.groups.append(group_row)
+                        group_id = group_row["id"]
+                    else:
+                        group_id, current_order = found
+                        if current_order != group_order:
+                            rows.group_orders[group_id] = group_order
+                    existing.groups[group_key] = (group_id, group_order)
                     stats.groups_created += 1
-                    logger.info(f"    Group: {group.name}")
-
-                    for q_order, parsed_question in enumerate(
-                        parsed_group.questions, start=1
-                    ):
-                        # Calculate inverse scores
-                        no_score, yes_score = calculate_scores(
-                            parsed_question.option_text, parsed_question.score
-                        )
+                    logger.info(f"    Group: {parsed_group.name}")
 
-                        # Create question with options
-                        await create_question(
-                            session,
-                            group.id,
+                    # Calculate inverse scores, then plan the whole group at once
+                    group_questions = [
+                        (
                             parsed_question.text,
-                            q_order,
-                            no_score,
-                            yes_score,
+                            *calculate_scores(
+                                parsed_question.option_text, parsed_question.score
+                            ),
                         )
-                        stats.questions_created += 1
-                        stats.options_created += 2
+                        for parsed_question in parsed_group.questions
+                    ]
+                    plan_group_questions(
+                        rows,
+                        group_id,
+                        group_questions,
+                        existing.questions.setdefault(group_id, {}),
+                    )
+                    stats.questions_created += len(group_questions)
+                    stats.options_created += 2 * len(group_questions)
 
                     logger.info(f"      Created {len(parsed_group.questions)} questions")
 
+            # Write the whole file: one statement per table
+            await write_pending_rows(session, rows)
+
         except Exception as e:
             logger.error(f"Error processing {md_file.name}: {e}")
             stats.errors += 1
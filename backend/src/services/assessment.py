@@ -94,8 +94,8 @@ class AssessmentService:
         return f"{settings.public_url}/a/{token}"
 
     async def get_by_id(self, assessment_id: UUID) -> Assessment | None:
-        """Get an assessment by ID."""
-        return await self.assessment_repo.get_by_id(assessment_id)
+        """Get an assessment by ID with respondent loaded."""
+        return await self.assessment_repo.get_by_id_with_respondent(assessment_id)
 
     async def get_by_token(self, token: str) -> Assessment | None:
         """Get an assessment by token.
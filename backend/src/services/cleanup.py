@@ -1,18 +1,23 @@
 """Service for admin cleanup operations on orphaned drafts and images."""
 
+import logging
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import Select, Text, any_, cast, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.storage import delete_file
+from src.core.storage import delete_files
 from src.models.answer import Answer
 from src.models.assessment import Assessment
 from src.models.assessment_draft import AssessmentDraft
 from src.models.attachment import Attachment
 from src.models.enums import AssessmentStatus
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Response data classes
@@ -49,10 +54,37 @@ class ImageCleanupResult:
     dry_run: bool = False
 
 
+# ============================================================================
+# Storage helpers
+# ============================================================================
+
+async def _delete_files(storage_keys: list[str]) -> set[str]:
+    """Delete objects from storage in batches.
+
+    Failures are logged rather than raised, so an unavailable storage does
+    not fail the cleanup.
+
+    Returns:
+        The keys that could not be deleted.
+    """
+    try:
+        return await delete_files(storage_keys)
+    except Exception:
+        logger.exception("Storage delete failed for %d keys", len(storage_keys))
+        return set(storage_keys)
+
+
 # ============================================================================
 # Service
 # ============================================================================
 
+# Attachment rows fetched per round trip when streaming cleanup candidates;
+# also caps each DELETE's IN list well under PostgreSQL's bind-parameter limit
+_STREAM_BATCH_SIZE = 1000
+
+# Only what deletion needs; plain rows skip ORM identity-map and state setup
+_ATTACHMENT_DELETE_COLUMNS = (Attachment.id, Attachment.size_bytes, Attachment.storage_key)
+
 
 class CleanupService:
     """Service for cleaning up orphaned drafts and images."""
@@ -79,55 +111,56 @@ class CleanupService:
         """
         cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
 
-        # Find expired assessments with drafts
-        stmt = (
-            select(Assessment, AssessmentDraft)
-            .join(AssessmentDraft, Assessment.id == AssessmentDraft.assessment_id)
-            .where(
-                Assessment.expires_at < cutoff,
-                Assessment.status != AssessmentStatus.COMPLETED,
-            )
+        expired = (
+            AssessmentDraft.assessment_id == Assessment.id,
+            Assessment.expires_at < cutoff,
+            Assessment.status != AssessmentStatus.COMPLETED,
         )
+        # Measured in PostgreSQL so the JSON payload is never loaded into Python
+        draft_size_bytes = func.octet_length(cast(AssessmentDraft.draft_data, Text))
+
+        if dry_run:
+            # Find expired assessments with drafts
+            stmt = select(Assessment.id, Assessment.expires_at, draft_size_bytes).where(
+                *expired
+            )
+        else:
+            # Delete their drafts in the same statement (DELETE ... USING ... RETURNING)
+            stmt = (
+                delete(AssessmentDraft)
+                .where(*expired)
+                .returning(Assessment.id, Assessment.expires_at, draft_size_bytes)
+                .execution_options(synchronize_session=False)
+            )
         result = await self.session.execute(stmt)
         rows = result.all()
+        if not rows:
+            # Common no-op cron run: nothing expired, nothing to flush
+            return DraftCleanupResult(dry_run=dry_run)
 
         details: list[CleanupDetail] = []
         total_storage_freed = 0
         images_deleted = 0
 
-        for assessment, draft in rows:
-            # Estimate draft size from JSON data
-            import json
-
-            draft_json = json.dumps(draft.draft_data)
-            draft_size = len(draft_json.encode("utf-8"))
-
+        for assessment_id, expires_at, draft_size in rows:
             details.append(
                 CleanupDetail(
-                    assessment_id=str(assessment.id),
-                    expired_at=assessment.expires_at.isoformat(),
+                    assessment_id=str(assessment_id),
+                    expired_at=expires_at.isoformat(),
                     draft_size_bytes=draft_size,
                 )
             )
             total_storage_freed += draft_size
 
-        if not dry_run and rows:
-            # Get list of assessment IDs to clean
-            assessment_ids = [assessment.id for assessment, _ in rows]
-
+        if not dry_run:
             # Delete orphaned images if requested
             if include_images:
+                assessment_ids = [assessment_id for assessment_id, _, _ in rows]
                 images_deleted, img_storage = await self._delete_orphaned_images_for_assessments(
                     assessment_ids
                 )
                 total_storage_freed += img_storage
 
-            # Delete the draft records
-            await self.session.execute(
-                delete(AssessmentDraft).where(
-                    AssessmentDraft.assessment_id.in_(assessment_ids)
-                )
-            )
             await self.session.flush()
 
         return DraftCleanupResult(
@@ -161,37 +194,29 @@ class CleanupService:
         # Find attachments not linked to any valid answer and older than cutoff
         # An orphaned attachment is one where the referenced answer doesn't exist
         # (the temporary UUID assigned during upload was never updated to a real answer)
-        orphaned_stmt = (
-            select(Attachment)
-            .outerjoin(Answer, Attachment.answer_id == Answer.id)
-            .where(
-                Answer.id.is_(None),
-                Attachment.created_at < cutoff,
-            )
+        orphaned = (
+            Answer.id.is_(None),
+            Attachment.created_at < cutoff,
         )
-        result = await self.session.execute(orphaned_stmt)
-        orphaned = result.scalars().all()
-
-        total_storage = sum(att.size_bytes for att in orphaned)
-
-        if not dry_run and orphaned:
-            # Delete from object storage
-            for attachment in orphaned:
-                try:
-                    await delete_file(attachment.storage_key)
-                except Exception:
-                    # Log but don't fail the batch if one file fails
-                    pass
-
-            # Delete DB records
-            orphaned_ids = [att.id for att in orphaned]
-            await self.session.execute(
-                delete(Attachment).where(Attachment.id.in_(orphaned_ids))
+
+        if dry_run:
+            # Count and size in PostgreSQL; a preview never hydrates rows
+            stmt = (
+                select(func.count(Attachment.id), func.coalesce(func.sum(Attachment.size_bytes), 0))
+                .outerjoin(Answer, Attachment.answer_id == Answer.id)
+                .where(*orphaned)
             )
-            await self.session.flush()
+            orphaned_count, total_storage = (await self.session.execute(stmt)).one()
+        else:
+            stmt = (
+                select(*_ATTACHMENT_DELETE_COLUMNS)
+                .outerjoin(Answer, Attachment.answer_id == Answer.id)
+                .where(*orphaned)
+            )
+            orphaned_count, total_storage = await self._delete_attachments(stmt)
 
         return ImageCleanupResult(
-            images_deleted=len(orphaned) if not dry_run else 0,
+            images_deleted=orphaned_count if not dry_run else 0,
             storage_freed_bytes=total_storage,
             dry_run=dry_run,
         )
@@ -205,32 +230,48 @@ class CleanupService:
         Returns:
             Tuple of (images_deleted_count, storage_freed_bytes).
         """
-        # Find attachments linked to these assessments via storage_key pattern
-        # Storage keys follow: assessments/{assessment_id}/...
-        deleted_count = 0
-        freed_bytes = 0
-
-        for assessment_id in assessment_ids:
-            prefix = f"assessments/{assessment_id}/"
-            stmt = select(Attachment).where(
-                Attachment.storage_key.startswith(prefix)
-            )
-            result = await self.session.execute(stmt)
-            attachments = result.scalars().all()
-
-            for attachment in attachments:
-                try:
-                    await delete_file(attachment.storage_key)
-                except Exception:
-                    pass
-                freed_bytes += attachment.size_bytes
-                deleted_count += 1
-
-            if attachments:
-                att_ids = [a.id for a in attachments]
-                await self.session.execute(
-                    delete(Attachment).where(Attachment.id.in_(att_ids))
-                )
+        # Indexed lookup on attachments.assessment_id, with all IDs bound as
+        # a single array parameter
+        stmt = select(*_ATTACHMENT_DELETE_COLUMNS).where(
+            Attachment.assessment_id == any_(literal(assessment_ids, ARRAY(UUID(as_uuid=True))))
+        )
+        return await self._delete_attachments(stmt)
 
-        await self.session.flush()
-        return deleted_count, freed_bytes
+    async def _delete_attachments(
+        self, stmt: Select[tuple[uuid.UUID, int, str]]
+    ) -> tuple[int, int]:
+        """Delete the attachments selected by stmt from storage and the database.
+
+        Rows are streamed from a server-side cursor and their objects removed
+        from storage _STREAM_BATCH_SIZE at a time, so memory stays flat no
+        matter how many attachments match. Only the IDs of attachments whose
+        objects were deleted are kept; their rows are deleted once the cursor
+        is exhausted. Attachments whose objects could not be deleted keep
+        their rows, so a later cleanup retries them.
+
+        Args:
+            stmt: SELECT of _ATTACHMENT_DELETE_COLUMNS for the attachments to
+                delete.
+
+        Returns:
+            Tuple of (attachments_deleted, storage_freed_bytes).
+        """
+        deleted_ids: list[uuid.UUID] = []
+        storage_bytes = 0
+        result = await self.session.stream(
+            stmt, execution_options={"yield_per": _STREAM_BATCH_SIZE}
+        )
+        async for rows in result.partitions():
+            failed_keys = await _delete_files([row.storage_key for row in rows])
+            for row in rows:
+                if row.storage_key not in failed_keys:
+                    deleted_ids.append(row.id)
+                    storage_bytes += row.size_bytes
+
+        for start in range(0, len(deleted_ids), _STREAM_BATCH_SIZE):
+            ids = deleted_ids[start : start + _STREAM_BATCH_SIZE]
+            await self.session.execute(delete(Attachment).where(Attachment.id.in_(ids)))
+
+        if deleted_ids:
+            await self.session.flush()
+        return len(deleted_ids), storage_bytes
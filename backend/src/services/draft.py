@@ -8,7 +8,7 @@ from src.models.assessment_draft import AssessmentDraft
 from src.models.enums import AssessmentStatus
 from src.repositories.assessment import AssessmentRepository
 from src.repositories.draft import DraftRepository
-from src.schemas.draft import DraftResponse, DraftSaveRequest, DraftSaveResponse
+from src.schemas.draft import DraftAnswer, DraftResponse, DraftSaveRequest, DraftSaveResponse
 
 
 class DraftService:
@@ -44,12 +44,9 @@ class DraftService:
         if assessment.status != AssessmentStatus.PENDING:
             raise ValueError("Assessment is not in pending status")
 
-        # Convert to dict for JSONB storage
-        draft_data = {
-            "answers": [answer.model_dump(mode="json") for answer in data.answers],
-            "current_type_index": data.current_type_index,
-            "current_group_index": data.current_group_index,
-        }
+        # Convert to dict for JSONB storage; the request's fields are exactly
+        # the stored keys, so one dump serializes all answers in pydantic-core
+        draft_data = data.model_dump(mode="json")
 
         # Upsert draft
         draft = await self.draft_repo.upsert(assessment_id, draft_data)
@@ -93,8 +90,6 @@ class DraftService:
 
     def _draft_to_response(self, draft: AssessmentDraft) -> DraftResponse:
         """Convert draft model to response schema."""
-        from src.schemas.draft import DraftAnswer
-
         draft_data = draft.draft_data
         answers = [
             DraftAnswer(**answer) for answer in draft_data.get("answers", [])
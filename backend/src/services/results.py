@@ -3,14 +3,15 @@
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.models.answer import Answer
 from src.models.assessment import Assessment
 from src.models.assessment_score import AssessmentScore
-from src.models.enums import OptionType, RiskRating
+from src.models.attachment import Attachment
+from src.models.enums import RiskRating
 from src.schemas.results import (
     AnswerBreakdown,
     AssessmentResultsResponse,
@@ -41,12 +42,15 @@ class ResultsService:
         Returns:
             AssessmentResultsResponse or None if not found/not completed.
         """
-        # Fetch assessment with respondent and submission contact
+        # Fetch assessment with respondent and submission contact; both are
+        # to-one, so they are joined into the same round trip. Scores come
+        # with it through one selectin query.
         stmt = (
             select(Assessment)
             .options(
-                selectinload(Assessment.respondent),
-                selectinload(Assessment.submission_contact),
+                joinedload(Assessment.respondent),
+                joinedload(Assessment.submission_contact),
+                selectinload(Assessment.scores),
             )
             .where(Assessment.id == assessment_id)
         )
@@ -56,26 +60,24 @@ class ResultsService:
         if assessment is None:
             return None
 
-        # Fetch scores
-        scores_stmt = select(AssessmentScore).where(
-            AssessmentScore.assessment_id == assessment_id
-        )
-        scores_result = await self.session.execute(scores_stmt)
-        scores = scores_result.scalars().all()
+        scores = assessment.scores
 
-        # Separate type scores, group scores, and overall score
-        type_scores_map: dict[str, TypeScore] = {}
+        # Separate type scores, group scores, and overall score. Every value
+        # here comes from our own DB rows, so models are built with
+        # model_construct and skip re-validation.
+        type_rows: dict[str, AssessmentScore] = {}
         group_scores_map: dict[str, list[GroupScore]] = {}
-        overall_score_data: OverallScore | None = None
+        overall_score: OverallScore | None = None
 
-        # Build lookups from snapshot for names
-        type_lookup = self._build_type_lookup(assessment.questions_snapshot)
-        group_lookup = self._build_group_lookup(assessment.questions_snapshot)
+        # Build lookups from snapshot for names in a single traversal
+        type_lookup, group_lookup, question_lookup = self._build_snapshot_lookups(
+            assessment.questions_snapshot, include_questions=include_breakdown
+        )
 
         for score in scores:
             if score.type_id is None and score.group_id is None:
                 # Overall score (no type_id and no group_id)
-                overall_score_data = OverallScore(
+                overall_score = OverallScore.model_construct(
                     raw_score=score.raw_score,
                     max_score=score.max_score,
                     percentage=float(score.percentage),
@@ -86,11 +88,16 @@ class ResultsService:
                     insurance_decision=score.insurance_decision,
                 )
             elif score.group_id is not None:
-                # Group-level score
-                group_info = group_lookup.get(str(score.group_id), {})
-                group_score = GroupScore(
+                # Group-level score, filed under its parent type's id string
+                group_info = group_lookup.get(str(score.group_id))
+                if group_info is not None:
+                    group_name, type_id_str = group_info["name"], group_info["type_id"]
+                else:
+                    group_name = "Unknown"
+                    type_id_str = str(score.type_id) if score.type_id else ""
+                group_score = GroupScore.model_construct(
                     group_id=score.group_id,
-                    group_name=group_info.get("name", "Unknown"),
+                    group_name=group_name,
                     raw_score=score.raw_score,
                     max_score=score.max_score,
                     percentage=float(score.percentage),
@@ -98,37 +105,33 @@ class ResultsService:
                     sum_score=score.raw_score,
                     classification_label=score.classification_label,
                 )
-                type_id_str = group_info.get("type_id", str(score.type_id) if score.type_id else "")
-                if type_id_str not in group_scores_map:
-                    group_scores_map[type_id_str] = []
-                group_scores_map[type_id_str].append(group_score)
+                group_scores_map.setdefault(type_id_str, []).append(group_score)
             elif score.type_id is not None:
-                # Type-level score (no group_id)
-                type_name = type_lookup.get(str(score.type_id), "Unknown")
-                type_scores_map[str(score.type_id)] = TypeScore(
-                    type_id=score.type_id,
-                    type_name=type_name,
-                    raw_score=score.raw_score,
-                    max_score=score.max_score,
-                    percentage=float(score.percentage),
-                    risk_rating=score.risk_rating,
-                    groups=[],
-                    probability_score=float(score.probability_score) if score.probability_score is not None else None,
-                    consequence_score=float(score.consequence_score) if score.consequence_score is not None else None,
-                    risk_value=score.risk_value,
-                    risk_grade=score.risk_grade,
-                    risk_description=score.risk_description,
-                )
-
-        # Attach group scores to their parent type scores
-        for type_id_str, type_score in type_scores_map.items():
-            type_score.groups = group_scores_map.get(type_id_str, [])
-
-        type_scores = list(type_scores_map.values())
+                # Type-level score (no group_id); built once all groups are in
+                type_rows[str(score.type_id)] = score
+
+        # TypeScore is frozen, so each one gets its finished group list
+        type_scores = [
+            TypeScore.model_construct(
+                type_id=score.type_id,
+                type_name=type_lookup.get(type_id_str, "Unknown"),
+                raw_score=score.raw_score,
+                max_score=score.max_score,
+                percentage=float(score.percentage),
+                risk_rating=score.risk_rating,
+                groups=group_scores_map.get(type_id_str, []),
+                probability_score=float(score.probability_score) if score.probability_score is not None else None,
+                consequence_score=float(score.consequence_score) if score.consequence_score is not None else None,
+                risk_value=score.risk_value,
+                risk_grade=score.risk_grade,
+                risk_description=score.risk_description,
+            )
+            for type_id_str, score in type_rows.items()
+        ]
 
         # Handle case where no overall score exists
-        if overall_score_data is None:
-            overall_score_data = OverallScore(
+        if overall_score is None:
+            overall_score = OverallScore.model_construct(
                 raw_score=0,
                 max_score=0,
                 percentage=0.0,
@@ -140,13 +143,13 @@ class ResultsService:
         if include_breakdown:
             answer_breakdown = await self._get_answer_breakdown(
                 assessment_id,
-                assessment.questions_snapshot,
+                question_lookup,
             )
 
         # Build contact info if available
         contact_info: SubmissionContactInfo | None = None
         if assessment.submission_contact:
-            contact_info = SubmissionContactInfo(
+            contact_info = SubmissionContactInfo.model_construct(
                 last_name=assessment.submission_contact.last_name,
                 first_name=assessment.submission_contact.first_name,
                 email=assessment.submission_contact.email,
@@ -154,7 +157,7 @@ class ResultsService:
                 position=assessment.submission_contact.position,
             )
 
-        return AssessmentResultsResponse(
+        return AssessmentResultsResponse.model_construct(
             assessment_id=assessment.id,
             respondent_id=assessment.respondent_id,
             respondent_name=assessment.respondent.name,
@@ -162,118 +165,103 @@ class ResultsService:
             completed_at=assessment.completed_at,
             contact=contact_info,
             type_scores=type_scores,
-            overall_score=overall_score_data,
+            overall_score=overall_score,
             answer_breakdown=answer_breakdown,
         )
 
-    def _build_type_lookup(self, snapshot: dict[str, Any]) -> dict[str, str]:
-        """Build a lookup dict from type_id to type_name from snapshot.
-
-        Args:
-            snapshot: Questions snapshot JSONB.
-
-        Returns:
-            Dict mapping type_id string to type_name.
-        """
-        lookup = {}
-        for type_data in snapshot.get("types", []):
-            type_id = type_data.get("id")
-            type_name = type_data.get("name", "Unknown")
-            if type_id:
-                lookup[str(type_id)] = type_name
-        return lookup
-
-    def _build_group_lookup(self, snapshot: dict[str, Any]) -> dict[str, dict[str, Any]]:
-        """Build lookup dict from group_id to group data.
-
-        Args:
-            snapshot: Questions snapshot JSONB.
-
-        Returns:
-            Dict mapping group_id to group data including type_id.
-        """
-        lookup = {}
-        for type_data in snapshot.get("types", []):
-            type_id = type_data.get("id")
-            for group in type_data.get("groups", []):
-                group_id = group.get("id")
-                if group_id:
-                    lookup[str(group_id)] = {
-                        "name": group.get("name", "Unknown"),
-                        "type_id": str(type_id) if type_id else "",
-                    }
-        return lookup
-
-    def _build_question_lookup(
-        self, snapshot: dict[str, Any]
-    ) -> dict[str, dict[str, Any]]:
-        """Build lookup dict from question_id to question data.
+    def _build_snapshot_lookups(
+        self, snapshot: dict[str, Any], include_questions: bool = True
+    ) -> tuple[dict[str, str], dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Build type, group, and question lookups in one pass over the snapshot.
 
         Args:
             snapshot: Questions snapshot JSONB (hierarchical Type→Group→Question).
+            include_questions: Whether to build the question lookup; it is only
+                needed for the answer breakdown.
 
         Returns:
-            Dict mapping question_id to question data including type and group info.
+            Tuple of dicts keyed by id string: type_id to type_name, group_id to
+            group data including type_id, and question_id to question data
+            including type and group info (empty if not requested).
         """
-        lookup = {}
+        type_lookup: dict[str, str] = {}
+        group_lookup: dict[str, dict[str, Any]] = {}
+        question_lookup: dict[str, dict[str, Any]] = {}
         for type_data in snapshot.get("types", []):
             type_id = type_data.get("id")
             type_name = type_data.get("name", "Unknown")
+            type_id_str = str(type_id) if type_id else ""
+            # Parsed once per type rather than once per answer in the breakdown
+            type_id_uuid = UUID(type_id_str) if type_id else None
+            if type_id:
+                type_lookup[type_id_str] = type_name
 
             # Handle hierarchical structure (Type → Group → Questions)
             for group in type_data.get("groups", []):
                 group_id = group.get("id")
                 group_name = group.get("name", "Unknown")
+                if group_id:
+                    group_lookup[str(group_id)] = {"name": group_name, "type_id": type_id_str}
 
+                if not include_questions:
+                    continue
                 for question in group.get("questions", []):
                     question_id = question.get("id")
                     if question_id:
-                        lookup[str(question_id)] = {
+                        question_lookup[str(question_id)] = {
                             "text": question.get("text", ""),
                             "type_id": type_id,
+                            "type_id_uuid": type_id_uuid,
                             "type_name": type_name,
                             "group_id": group_id,
                             "group_name": group_name,
                             "options": question.get("options", {}),
                         }
 
+            if not include_questions:
+                continue
             # Also handle flat structure for backwards compatibility
             for question in type_data.get("questions", []):
                 question_id = question.get("id")
-                if question_id and str(question_id) not in lookup:
-                    lookup[str(question_id)] = {
+                if question_id and str(question_id) not in question_lookup:
+                    question_lookup[str(question_id)] = {
                         "text": question.get("text", ""),
                         "type_id": type_id,
+                        "type_id_uuid": type_id_uuid,
                         "type_name": type_name,
                         "options": question.get("options", {}),
                     }
-        return lookup
+        return type_lookup, group_lookup, question_lookup
 
     async def _get_answer_breakdown(
         self,
         assessment_id: UUID,
-        snapshot: dict[str, Any],
+        question_lookup: dict[str, dict[str, Any]],
     ) -> list[AnswerBreakdown]:
         """Get detailed answer breakdown for an assessment.
 
         Args:
             assessment_id: Assessment UUID.
-            snapshot: Questions snapshot JSONB.
+            question_lookup: Question lookup from _build_snapshot_lookups.
 
         Returns:
             List of AnswerBreakdown items.
         """
-        # Fetch answers with attachments
+        # Fetch only the answer columns we report, with attachments counted in SQL
         stmt = (
-            select(Answer)
-            .options(selectinload(Answer.attachments))
+            select(
+                Answer.question_id,
+                Answer.selected_option,
+                Answer.comment,
+                Answer.score_awarded,
+                func.count(Attachment.id).label("attachment_count"),
+            )
+            .outerjoin(Attachment, Attachment.answer_id == Answer.id)
             .where(Answer.assessment_id == assessment_id)
+            .group_by(Answer.id)
         )
         result = await self.session.execute(stmt)
-        answers = result.scalars().all()
-
-        # Build question lookup from snapshot
-        question_lookup = self._build_question_lookup(snapshot)
+        answers = result.all()
 
         breakdown: list[AnswerBreakdown] = []
         for answer in answers:
@@ -286,16 +274,16 @@ class ResultsService:
             max_score = max(yes_score, no_score)
 
             breakdown.append(
-                AnswerBreakdown(
+                AnswerBreakdown.model_construct(
                     question_id=answer.question_id,
                     question_text=question_data.get("text", ""),
-                    type_id=UUID(question_data.get("type_id")) if question_data.get("type_id") else answer.question_id,
+                    type_id=question_data.get("type_id_uuid") or answer.question_id,
                     type_name=question_data.get("type_name", "Unknown"),
                     selected_option=answer.selected_option,
                     comment=answer.comment,
                     score_awarded=answer.score_awarded,
                     max_score=max_score,
-                    attachment_count=len(answer.attachments),
+                    attachment_count=answer.attachment_count,
                 )
             )
 
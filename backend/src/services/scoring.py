@@ -1,10 +1,13 @@
 """Service for calculating assessment scores with hierarchical structure."""
 
 import statistics
+from bisect import bisect_left
+from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
 from typing import Any
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.assessment_score import AssessmentScore
@@ -25,6 +28,7 @@ _GRADE_TABLE: list[tuple[int, str, str]] = [
     (16, "DDD", "Ноцтой, эрсдэл дээгүүр"),
     (20, "DD", "Нэн ноцтой, эрсдэл дээгүүр"),
 ]
+_GRADE_MAX_VALUES: list[int] = [max_val for max_val, _, _ in _GRADE_TABLE]
 
 # Classification mapping: sum_score -> (label, numeric_value)
 _CLASSIFICATION_MAP: dict[int, tuple[str, int]] = {
@@ -35,6 +39,55 @@ _CLASSIFICATION_MAP: dict[int, tuple[str, int]] = {
 }
 
 
+@dataclass(slots=True)
+class GroupScoreResult:
+    """Calculated score for a single question group."""
+
+    group_id: str
+    group_name: str
+    raw_score: int
+    max_score: int
+    percentage: float
+    risk_rating: RiskRating
+    weight: float
+    sum_score: int
+    classification_label: str
+    numeric_value: int
+
+
+@dataclass(slots=True)
+class TypeScoreResult:
+    """Calculated score for a questionnaire type with its group breakdown."""
+
+    type_id: str
+    type_name: str
+    raw_score: int
+    max_score: int
+    percentage: float
+    risk_rating: RiskRating
+    weight: float
+    groups: list[GroupScoreResult]
+    probability_score: float
+    consequence_score: float
+    risk_value: int
+    risk_grade: str
+    risk_description: str
+
+
+@dataclass(slots=True)
+class OverallScoreResult:
+    """Calculated overall score aggregated from type scores."""
+
+    raw_score: int
+    max_score: int
+    percentage: float
+    risk_rating: RiskRating
+    risk_value: int | None
+    risk_grade: str | None
+    risk_description: str | None
+    insurance_decision: str | None
+
+
 def classify_group(sum_score: int) -> tuple[str, int]:
     """Classify a group based on its sum score.
 
@@ -51,6 +104,21 @@ def classify_group(sum_score: int) -> tuple[str, int]:
     return _CLASSIFICATION_MAP.get(sum_score, ("Аюултай", 5))
 
 
+def question_max_score(question: dict[str, Any]) -> int:
+    """Get the maximum possible score for a snapshot question.
+
+    Args:
+        question: Question data from snapshot including options.
+
+    Returns:
+        The higher of the YES and NO option scores.
+    """
+    options = question.get("options", {})
+    yes_score = options.get("YES", {}).get("score", 0)
+    no_score = options.get("NO", {}).get("score", 0)
+    return max(yes_score, no_score)
+
+
 def lookup_grade(risk_value: int) -> tuple[str, str]:
     """Look up risk grade and description from a risk value.
 
@@ -60,9 +128,11 @@ def lookup_grade(risk_value: int) -> tuple[str, str]:
     Returns:
         Tuple of (grade, description) in Mongolian.
     """
-    for max_val, grade, description in _GRADE_TABLE:
-        if risk_value <= max_val:
-            return (grade, description)
+    # Binary search for the first max_value >= risk_value
+    index = bisect_left(_GRADE_MAX_VALUES, risk_value)
+    if index < len(_GRADE_TABLE):
+        _, grade, description = _GRADE_TABLE[index]
+        return (grade, description)
     return ("D", "Аюултай, эрсдэл өндөр")
 
 
@@ -94,6 +164,52 @@ def round_half_up(value: float) -> int:
     return int(Decimal(str(value)).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
 
 
+def _hundredths_decimal(value: float) -> Decimal:
+    """Convert a percentage already rounded to 2 places into an exact Decimal.
+
+    Builds the Decimal from the integer number of hundredths, which avoids
+    formatting the float to a string and parsing it back.
+    """
+    return Decimal(round(value * 100)).scaleb(-2)
+
+
+def _score_row(
+    assessment_id: UUID,
+    type_id: UUID | None,
+    group_id: UUID | None,
+    score: GroupScoreResult | TypeScoreResult | OverallScoreResult,
+    *,
+    classification_label: str | None = None,
+    probability_score: Decimal | None = None,
+    consequence_score: Decimal | None = None,
+    risk_value: int | None = None,
+    risk_grade: str | None = None,
+    risk_description: str | None = None,
+    insurance_decision: str | None = None,
+) -> dict[str, Any]:
+    """Build an assessment_scores row; every row carries the same keys.
+
+    A multi-row VALUES insert needs identical keys in each row, so the
+    level-specific columns default to NULL.
+    """
+    return {
+        "assessment_id": assessment_id,
+        "type_id": type_id,
+        "group_id": group_id,
+        "raw_score": score.raw_score,
+        "max_score": score.max_score,
+        "percentage": _hundredths_decimal(score.percentage),
+        "risk_rating": score.risk_rating,
+        "classification_label": classification_label,
+        "probability_score": probability_score,
+        "consequence_score": consequence_score,
+        "risk_value": risk_value,
+        "risk_grade": risk_grade,
+        "risk_description": risk_description,
+        "insurance_decision": insurance_decision,
+    }
+
+
 class ScoringService:
     """Service for calculating hierarchical assessment scores.
 
@@ -136,7 +252,7 @@ class ScoringService:
         answers_by_question: dict[str, int],
         threshold_high: int = 80,
         threshold_medium: int = 50,
-    ) -> dict[str, Any]:
+    ) -> GroupScoreResult:
         """Calculate score for a single question group.
 
         Args:
@@ -146,24 +262,22 @@ class ScoringService:
             threshold_medium: Threshold for MEDIUM risk rating.
 
         Returns:
-            Dict with group_id, group_name, raw_score, max_score, percentage, risk_rating, weight.
+            GroupScoreResult with scores, risk rating, weight, and classification.
         """
-        raw_score = 0
-        max_score = 0
-
-        for question in group_data.get("questions", []):
-            question_id = question["id"]
-            options = question.get("options", {})
-
-            # Get max possible score for this question
-            yes_score = options.get("YES", {}).get("score", 0)
-            no_score = options.get("NO", {}).get("score", 0)
-            question_max = max(yes_score, no_score)
-            max_score += question_max
-
-            # Get awarded score
-            if question_id in answers_by_question:
-                raw_score += answers_by_question[question_id]
+        questions = group_data.get("questions", [])
+
+        # Max possible score is cached on the snapshot at creation; snapshots
+        # created before that fall back to summing each question's best option
+        max_score = group_data.get("max_score")
+        if max_score is None:
+            max_score = sum(question_max_score(question) for question in questions)
+
+        # Get awarded score
+        raw_score = sum(
+            answers_by_question[question["id"]]
+            for question in questions
+            if question["id"] in answers_by_question
+        )
 
         # Calculate percentage
         percentage = (raw_score / max_score * 100) if max_score > 0 else 0.0
@@ -177,24 +291,24 @@ class ScoringService:
         sum_score = raw_score
         classification_label, numeric_value = classify_group(sum_score)
 
-        return {
-            "group_id": group_data["id"],
-            "group_name": group_data["name"],
-            "raw_score": raw_score,
-            "max_score": max_score,
-            "percentage": round(percentage, 2),
-            "risk_rating": risk_rating,
-            "weight": group_data.get("weight", 1.0),
-            "sum_score": sum_score,
-            "classification_label": classification_label,
-            "numeric_value": numeric_value,
-        }
+        return GroupScoreResult(
+            group_id=group_data["id"],
+            group_name=group_data["name"],
+            raw_score=raw_score,
+            max_score=max_score,
+            percentage=round(percentage, 2),
+            risk_rating=risk_rating,
+            weight=group_data.get("weight", 1.0),
+            sum_score=sum_score,
+            classification_label=classification_label,
+            numeric_value=numeric_value,
+        )
 
     def calculate_type_score(
         self,
         type_data: dict[str, Any],
         answers_by_question: dict[str, int],
-    ) -> dict[str, Any]:
+    ) -> TypeScoreResult:
         """Calculate score for a single questionnaire type with group breakdown.
 
         Args:
@@ -202,7 +316,7 @@ class ScoringService:
             answers_by_question: Map of question_id -> score_awarded.
 
         Returns:
-            Dict with type_id, type_name, raw_score, max_score, percentage, risk_rating, weight, groups.
+            TypeScoreResult with scores, risk grading, weight, and group scores.
         """
         threshold_high = type_data.get("threshold_high", 80)
         threshold_medium = type_data.get("threshold_medium", 50)
@@ -218,21 +332,26 @@ class ScoringService:
             )
             group_scores.append(group_score)
 
-        # Aggregate raw scores across all groups
-        total_raw = sum(gs["raw_score"] for gs in group_scores)
-        total_max = sum(gs["max_score"] for gs in group_scores)
+        # Aggregate raw scores, weighted percentages, and the per-group risk
+        # inputs in a single pass over the groups
+        total_raw = 0
+        total_max = 0
+        total_weighted_percentage = 0
+        total_weight = 0
+        group_sum_scores: list[float] = []
+        group_numeric_values: list[float] = []
+        for gs in group_scores:
+            total_raw += gs.raw_score
+            total_max += gs.max_score
+            total_weighted_percentage += gs.percentage * gs.weight
+            total_weight += gs.weight
+            group_sum_scores.append(float(gs.sum_score))
+            group_numeric_values.append(float(gs.numeric_value))
 
         # Weighted percentage calculation from groups
-        if group_scores:
-            total_weighted_percentage = sum(
-                gs["percentage"] * gs["weight"] for gs in group_scores
-            )
-            total_weight = sum(gs["weight"] for gs in group_scores)
-            type_percentage = (
-                total_weighted_percentage / total_weight if total_weight > 0 else 0.0
-            )
-        else:
-            type_percentage = 0.0
+        type_percentage = (
+            total_weighted_percentage / total_weight if total_weight > 0 else 0.0
+        )
 
         # Calculate risk rating for type
         risk_rating = self.calculate_risk_rating(
@@ -240,9 +359,6 @@ class ScoringService:
         )
 
         # New risk grading: probability and consequence scores per type
-        group_sum_scores = [float(gs["sum_score"]) for gs in group_scores]
-        group_numeric_values = [float(gs["numeric_value"]) for gs in group_scores]
-
         probability_score = (
             statistics.mean(group_sum_scores) + 0.618 * safe_stdev(group_sum_scores)
             if group_sum_scores
@@ -258,26 +374,26 @@ class ScoringService:
         type_risk_value = round_half_up(probability_score * consequence_score)
         type_risk_grade, type_risk_description = lookup_grade(type_risk_value)
 
-        return {
-            "type_id": type_data["id"],
-            "type_name": type_data["name"],
-            "raw_score": total_raw,
-            "max_score": total_max,
-            "percentage": round(type_percentage, 2),
-            "risk_rating": risk_rating,
-            "weight": type_data.get("weight", 1.0),
-            "groups": group_scores,
-            "probability_score": round(probability_score, 4),
-            "consequence_score": round(consequence_score, 4),
-            "risk_value": type_risk_value,
-            "risk_grade": type_risk_grade,
-            "risk_description": type_risk_description,
-        }
+        return TypeScoreResult(
+            type_id=type_data["id"],
+            type_name=type_data["name"],
+            raw_score=total_raw,
+            max_score=total_max,
+            percentage=round(type_percentage, 2),
+            risk_rating=risk_rating,
+            weight=type_data.get("weight", 1.0),
+            groups=group_scores,
+            probability_score=round(probability_score, 4),
+            consequence_score=round(consequence_score, 4),
+            risk_value=type_risk_value,
+            risk_grade=type_risk_grade,
+            risk_description=type_risk_description,
+        )
 
     def calculate_overall_score(
         self,
-        type_scores: list[dict[str, Any]],
-    ) -> dict[str, Any]:
+        type_scores: list[TypeScoreResult],
+    ) -> OverallScoreResult:
         """Calculate overall score from type scores.
 
         Uses weighted average based on type weights.
@@ -286,17 +402,20 @@ class ScoringService:
             type_scores: List of type score results.
 
         Returns:
-            Dict with raw_score, max_score, percentage, risk_rating.
+            OverallScoreResult with scores, risk grading, and insurance decision.
         """
-        total_raw = sum(ts["raw_score"] for ts in type_scores)
-        total_max = sum(ts["max_score"] for ts in type_scores)
+        # Aggregate raw scores and weighted percentages in a single pass
+        total_raw = 0
+        total_max = 0
+        total_weighted_percentage = 0
+        total_weight = 0
+        for ts in type_scores:
+            total_raw += ts.raw_score
+            total_max += ts.max_score
+            total_weighted_percentage += ts.percentage * ts.weight
+            total_weight += ts.weight
 
         # Weighted percentage calculation
-        total_weighted_percentage = sum(
-            ts["percentage"] * ts["weight"] for ts in type_scores
-        )
-        total_weight = sum(ts["weight"] for ts in type_scores)
-
         overall_percentage = (
             total_weighted_percentage / total_weight if total_weight > 0 else 0.0
         )
@@ -306,9 +425,9 @@ class ScoringService:
 
         # New risk grading: aggregate type risk values
         type_risk_values = [
-            float(ts["risk_value"])
+            float(ts.risk_value)
             for ts in type_scores
-            if ts.get("risk_value") is not None
+            if ts.risk_value is not None
         ]
 
         total_risk: int | None = None
@@ -324,23 +443,23 @@ class ScoringService:
             total_grade, risk_description = lookup_grade(total_risk)
             insurance_decision = "Даатгахгүй" if total_risk > 16 else "Даатгана"
 
-        return {
-            "raw_score": total_raw,
-            "max_score": total_max,
-            "percentage": round(overall_percentage, 2),
-            "risk_rating": risk_rating,
-            "risk_value": total_risk,
-            "risk_grade": total_grade,
-            "risk_description": risk_description,
-            "insurance_decision": insurance_decision,
-        }
+        return OverallScoreResult(
+            raw_score=total_raw,
+            max_score=total_max,
+            percentage=round(overall_percentage, 2),
+            risk_rating=risk_rating,
+            risk_value=total_risk,
+            risk_grade=total_grade,
+            risk_description=risk_description,
+            insurance_decision=insurance_decision,
+        )
 
     async def save_scores(
         self,
         assessment_id: UUID,
-        type_scores: list[dict[str, Any]],
-        overall_score: dict[str, Any],
-    ) -> list[AssessmentScore]:
+        type_scores: list[TypeScoreResult],
+        overall_score: OverallScoreResult,
+    ) -> None:
         """Save calculated scores to database.
 
         Saves scores at three levels:
@@ -348,69 +467,60 @@ class ScoringService:
         - Type scores (group_id NULL, type_id set)
         - Overall score (group_id NULL, type_id NULL)
 
+        All rows go out in a single multi-row INSERT rather than one ORM
+        insert per score.
+
         Args:
             assessment_id: Assessment UUID.
             type_scores: List of per-type score results with nested groups.
             overall_score: Overall score result.
-
-        Returns:
-            List of created AssessmentScore records.
         """
-        scores = []
+        rows: list[dict[str, Any]] = []
 
         # Save per-type and per-group scores
         for ts in type_scores:
-            type_uuid = UUID(ts["type_id"])
+            type_uuid = UUID(ts.type_id)
 
             # Save group-level scores
-            for gs in ts.get("groups", []):
-                group_score = AssessmentScore(
-                    assessment_id=assessment_id,
-                    type_id=type_uuid,
-                    group_id=UUID(gs["group_id"]),
-                    raw_score=gs["raw_score"],
-                    max_score=gs["max_score"],
-                    percentage=Decimal(str(gs["percentage"])),
-                    risk_rating=gs["risk_rating"],
-                    classification_label=gs.get("classification_label"),
+            for gs in ts.groups:
+                rows.append(
+                    _score_row(
+                        assessment_id,
+                        type_uuid,
+                        UUID(gs.group_id),
+                        gs,
+                        classification_label=gs.classification_label,
+                    )
                 )
-                self.session.add(group_score)
-                scores.append(group_score)
 
             # Save type-level score (group_id = NULL)
-            type_score = AssessmentScore(
-                assessment_id=assessment_id,
-                type_id=type_uuid,
-                group_id=None,
-                raw_score=ts["raw_score"],
-                max_score=ts["max_score"],
-                percentage=Decimal(str(ts["percentage"])),
-                risk_rating=ts["risk_rating"],
-                probability_score=Decimal(str(ts["probability_score"])) if ts.get("probability_score") is not None else None,
-                consequence_score=Decimal(str(ts["consequence_score"])) if ts.get("consequence_score") is not None else None,
-                risk_value=ts.get("risk_value"),
-                risk_grade=ts.get("risk_grade"),
-                risk_description=ts.get("risk_description"),
+            rows.append(
+                _score_row(
+                    assessment_id,
+                    type_uuid,
+                    None,
+                    ts,
+                    probability_score=Decimal(str(ts.probability_score)),
+                    consequence_score=Decimal(str(ts.consequence_score)),
+                    risk_value=ts.risk_value,
+                    risk_grade=ts.risk_grade,
+                    risk_description=ts.risk_description,
+                )
             )
-            self.session.add(type_score)
-            scores.append(type_score)
 
         # Save overall score (type_id = NULL, group_id = NULL)
-        overall = AssessmentScore(
-            assessment_id=assessment_id,
-            type_id=None,
-            group_id=None,
-            raw_score=overall_score["raw_score"],
-            max_score=overall_score["max_score"],
-            percentage=Decimal(str(overall_score["percentage"])),
-            risk_rating=overall_score["risk_rating"],
-            risk_value=overall_score.get("risk_value"),
-            risk_grade=overall_score.get("risk_grade"),
-            risk_description=overall_score.get("risk_description"),
-            insurance_decision=overall_score.get("insurance_decision"),
+        rows.append(
+            _score_row(
+                assessment_id,
+                None,
+                None,
+                overall_score,
+                risk_value=overall_score.risk_value,
+                risk_grade=overall_score.risk_grade,
+                risk_description=overall_score.risk_description,
+                insurance_decision=overall_score.insurance_decision,
+            )
         )
-        self.session.add(overall)
-        scores.append(overall)
 
-        await self.session.flush()
-        return scores
+        await self.session.execute(insert(AssessmentScore).values(rows))
+
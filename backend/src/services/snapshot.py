@@ -1,5 +1,7 @@
 """Service for creating question snapshots for assessments."""
 
+from itertools import groupby
+from operator import attrgetter
 from typing import Any
 from uuid import UUID
 
@@ -10,6 +12,9 @@ from src.repositories.question import QuestionRepository
 from src.repositories.question_group import QuestionGroupRepository
 from src.repositories.questionnaire_type import QuestionnaireTypeRepository
 
+# Snapshot options key for each option type
+_OPTION_KEYS: dict[OptionType, str] = {OptionType.YES: "YES", OptionType.NO: "NO"}
+
 
 class SnapshotService:
     """Service for creating deep copies of questions/options for assessments.
@@ -33,6 +38,7 @@ class SnapshotService:
         Returns:
             Snapshot dictionary with hierarchical structure:
             {
+                "total_questions": 1,
                 "types": [
                     {
                         "id": "uuid",
@@ -40,12 +46,14 @@ class SnapshotService:
                         "threshold_high": 80,
                         "threshold_medium": 50,
                         "weight": 1.0,
+                        "max_score": 25,
                         "groups": [
                             {
                                 "id": "uuid",
                                 "name": "Group Name",
                                 "display_order": 1,
                                 "weight": 1.0,
+                                "max_score": 10,
                                 "questions": [
                                     {
                                         "id": "uuid",
@@ -56,7 +64,8 @@ class SnapshotService:
                                         "options": {
                                             "YES": {...},
                                             "NO": {...}
-                                        }
+                                        },
+                                        "max_score": 1
                                     }
                                 ]
                             }
@@ -79,32 +88,28 @@ class SnapshotService:
                 f"Questionnaire types not found or inactive: {list(missing_ids)}"
             )
 
-        # Get all active groups for these types
+        # Get all active groups for these types; rows are ordered by type_id,
+        # then display_order, so each type's groups are contiguous and sorted
         groups = await self.group_repo.get_active_by_type_ids(type_ids)
-        groups_by_type: dict[UUID, list] = {}
-        for group in groups:
-            if group.type_id not in groups_by_type:
-                groups_by_type[group.type_id] = []
-            groups_by_type[group.type_id].append(group)
-
-        # Get all questions for these groups
-        group_ids = [g.id for g in groups]
-        questions = await self.question_repo.get_by_group_ids_with_options(
-            group_ids, is_active=True
-        )
-        questions_by_group: dict[UUID, list] = {}
-        for question in questions:
-            if question.group_id not in questions_by_group:
-                questions_by_group[question.group_id] = []
-            questions_by_group[question.group_id].append(question)
+        groups_by_type: dict[UUID, list] = {
+            type_id: list(type_groups)
+            for type_id, type_groups in groupby(groups, key=attrgetter("type_id"))
+        }
+
+        # Get all active questions in those groups with options (one query)
+        questions = await self.question_repo.get_active_by_type_ids_with_options(type_ids)
+        # Rows are ordered by group_id, so each group's questions are contiguous
+        questions_by_group: dict[UUID, list] = {
+            group_id: list(group_questions)
+            for group_id, group_questions in groupby(questions, key=attrgetter("group_id"))
+        }
 
         snapshot_types = []
 
         for qtype in types:
-            type_groups = groups_by_type.get(qtype.id, [])
             snapshot_groups = []
 
-            for group in type_groups:
+            for group in groups_by_type.get(qtype.id, []):
                 group_questions = questions_by_group.get(group.id, [])
                 snapshot_questions = []
 
@@ -120,10 +125,7 @@ class SnapshotService:
                             "max_images": option.max_images,
                             "image_max_mb": option.image_max_mb,
                         }
-                        if option.option_type == OptionType.YES:
-                            options_dict["YES"] = option_data
-                        else:
-                            options_dict["NO"] = option_data
+                        options_dict[_OPTION_KEYS[option.option_type]] = option_data
 
                     # Ensure both YES and NO options exist
                     if "YES" not in options_dict or "NO" not in options_dict:
@@ -138,35 +140,45 @@ class SnapshotService:
                         "weight": float(question.weight),
                         "is_critical": question.is_critical,
                         "options": options_dict,
+                        # Invariant per snapshot, so scoring reads it instead of
+                        # recomputing it on every run
+                        "max_score": max(
+                            options_dict["YES"]["score"], options_dict["NO"]["score"]
+                        ),
                     })
 
-                # Sort questions by display_order
-                snapshot_questions.sort(key=lambda q: q["display_order"])
-
                 snapshot_groups.append({
                     "id": str(group.id),
                     "name": group.name,
                     "display_order": group.display_order,
                     "weight": float(group.weight),
+                    "max_score": sum(q["max_score"] for q in snapshot_questions),
                     "questions": snapshot_questions,
                 })
 
-            # Sort groups by display_order
-            snapshot_groups.sort(key=lambda g: g["display_order"])
-
             snapshot_types.append({
                 "id": str(qtype.id),
                 "name": qtype.name,
                 "threshold_high": qtype.threshold_high,
                 "threshold_medium": qtype.threshold_medium,
                 "weight": float(qtype.weight),
+                "max_score": sum(g["max_score"] for g in snapshot_groups),
                 "groups": snapshot_groups,
             })
 
-        return {"types": snapshot_types}
+        # Every loaded question lands in exactly one snapshot group
+        return {"total_questions": len(questions), "types": snapshot_types}
 
     def get_total_questions(self, snapshot: dict[str, Any]) -> int:
-        """Get total number of questions in a snapshot."""
+        """Get total number of questions in a snapshot.
+
+        Uses the count recorded by create_snapshot, falling back to a walk of
+        the tree for snapshots created before it was recorded.
+        """
+        cached_total = snapshot.get("total_questions")
+        if cached_total is not None:
+            return cached_total
+
         total = 0
         for qtype in snapshot.get("types", []):
             for group in qtype.get("groups", []):
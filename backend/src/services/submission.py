@@ -191,42 +191,42 @@ class SubmissionService:
             assessment_id=str(assessment.id),
             type_results=[
                 TypeResult(
-                    type_id=ts["type_id"],
-                    type_name=ts["type_name"],
-                    raw_score=ts["raw_score"],
-                    max_score=ts["max_score"],
-                    percentage=ts["percentage"],
-                    risk_rating=ts["risk_rating"],
-                    probability_score=ts.get("probability_score"),
-                    consequence_score=ts.get("consequence_score"),
-                    risk_value=ts.get("risk_value"),
-                    risk_grade=ts.get("risk_grade"),
-                    risk_description=ts.get("risk_description"),
+                    type_id=ts.type_id,
+                    type_name=ts.type_name,
+                    raw_score=ts.raw_score,
+                    max_score=ts.max_score,
+                    percentage=ts.percentage,
+                    risk_rating=ts.risk_rating,
+                    probability_score=ts.probability_score,
+                    consequence_score=ts.consequence_score,
+                    risk_value=ts.risk_value,
+                    risk_grade=ts.risk_grade,
+                    risk_description=ts.risk_description,
                     groups=[
                         GroupResult(
-                            group_id=gs["group_id"],
-                            group_name=gs["group_name"],
-                            raw_score=gs["raw_score"],
-                            max_score=gs["max_score"],
-                            percentage=gs["percentage"],
-                            risk_rating=gs["risk_rating"],
-                            sum_score=gs.get("sum_score"),
-                            classification_label=gs.get("classification_label"),
+                            group_id=gs.group_id,
+                            group_name=gs.group_name,
+                            raw_score=gs.raw_score,
+                            max_score=gs.max_score,
+                            percentage=gs.percentage,
+                            risk_rating=gs.risk_rating,
+                            sum_score=gs.sum_score,
+                            classification_label=gs.classification_label,
                         )
-                        for gs in ts.get("groups", [])
+                        for gs in ts.groups
                     ],
                 )
                 for ts in type_scores
             ],
             overall_result=OverallResult(
-                raw_score=overall_score["raw_score"],
-                max_score=overall_score["max_score"],
-                percentage=overall_score["percentage"],
-                risk_rating=overall_score["risk_rating"],
-                total_risk=overall_score.get("risk_value"),
-                total_grade=overall_score.get("risk_grade"),
-                risk_description=overall_score.get("risk_description"),
-                insurance_decision=overall_score.get("insurance_decision"),
+                raw_score=overall_score.raw_score,
+                max_score=overall_score.max_score,
+                percentage=overall_score.percentage,
+                risk_rating=overall_score.risk_rating,
+                total_risk=overall_score.risk_value,
+                total_grade=overall_score.risk_grade,
+                risk_description=overall_score.risk_description,
+                insurance_decision=overall_score.insurance_decision,
             ),
         )
 
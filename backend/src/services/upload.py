@@ -1,8 +1,8 @@
 """Service for handling file uploads."""
 
 import uuid
-from typing import BinaryIO
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
@@ -100,6 +100,7 @@ class UploadService:
         # For now, we create a temporary record
         attachment = Attachment(
             answer_id=uuid.uuid4(),  # Temporary, will be updated on submission
+            assessment_id=assessment_id,
             storage_key=storage_key,
             original_name=filename,
             size_bytes=len(content),
@@ -118,8 +119,6 @@ class UploadService:
 
     async def get_attachment(self, attachment_id: uuid.UUID) -> Attachment | None:
         """Get an attachment by ID."""
-        from sqlalchemy import select
-
         result = await self.session.execute(
             select(Attachment).where(Attachment.id == attachment_id)
         )
@@ -136,8 +135,6 @@ class UploadService:
             answer_id: Answer UUID.
             attachment_ids: List of attachment UUIDs to link.
         """
-        from sqlalchemy import update
-
         if attachment_ids:
             await self.session.execute(
                 update(Attachment)
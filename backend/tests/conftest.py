@@ -1,9 +1,16 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.core.database import async_session_factory
+from src.core.database import create_engine
+from src.models.assessment import Assessment
+from src.models.enums import RespondentKind
+from src.models.respondent import Respondent
 
 
 @pytest.fixture
@@ -13,7 +20,67 @@ def anyio_backend():
 
 
 @pytest.fixture
-async def async_session_factory():
+async def db_engine():
+    """Provide an engine bound to the current test's event loop."""
+    engine = create_engine()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def async_session_factory(db_engine):
     """Provide async session factory for tests."""
-    # Use the existing session factory from the app
-    yield async_session_factory
+    yield async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """Provide a session whose work is rolled back after the test."""
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture
+def statements(db_engine):
+    """Record the SQL statements sent to the database, minus savepoint bookkeeping."""
+    seen: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK")):
+            seen.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    yield seen
+    event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def make_assessment(db_session):
+    """Provide a factory for assessments with a fresh respondent."""
+
+    async def make(expires_at: datetime | None = None) -> Assessment:
+        respondent = Respondent(kind=RespondentKind.ORG, name=f"Test {uuid4()}")
+        db_session.add(respondent)
+        await db_session.flush()
+        assessment = Assessment(
+            respondent_id=respondent.id,
+            token_hash=uuid4().hex * 2,
+            selected_type_ids=[],
+            questions_snapshot={},
+            expires_at=expires_at or datetime.now(UTC) + timedelta(days=7),
+        )
+        db_session.add(assessment)
+        await db_session.flush()
+        return assessment
+
+    return make
@@ -0,0 +1,128 @@
+"""Integration tests for attachment cleanup."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.answer import Answer
+from src.models.assessment import Assessment
+from src.models.attachment import Attachment
+from src.models.enums import OptionType
+from src.services import cleanup
+from src.services.cleanup import CleanupService
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def storage_deletes(statements, monkeypatch):
+    """Record storage delete batches with the SQL statement count at each call.
+
+    Storage reports keys containing "fail" as not deleted.
+    """
+    seen: list[tuple[int, list[str]]] = []
+
+    async def fake_delete_files(storage_keys: list[str]) -> set[str]:
+        seen.append((len(statements), list(storage_keys)))
+        return {key for key in storage_keys if "fail" in key}
+
+    monkeypatch.setattr(cleanup, "delete_files", fake_delete_files)
+    monkeypatch.setattr(cleanup, "_STREAM_BATCH_SIZE", 2)
+    return seen
+
+
+@pytest.fixture
+def add_attachments(db_session, make_assessment):
+    """Provide a factory for an expired assessment with one attachment per key."""
+
+    async def add(storage_keys: list[str]) -> Assessment:
+        assessment = await make_assessment(expires_at=datetime.now(UTC) - timedelta(days=60))
+        answer = Answer(
+            assessment_id=assessment.id,
+            question_id=uuid4(),
+            selected_option=OptionType.NO,
+            score_awarded=0,
+        )
+        db_session.add(answer)
+        await db_session.flush()
+        db_session.add_all(
+            Attachment(
+                answer_id=answer.id,
+                assessment_id=assessment.id,
+                storage_key=key,
+                original_name=f"{key}.png",
+                size_bytes=100,
+                mime_type="image/png",
+            )
+            for key in storage_keys
+        )
+        await db_session.flush()
+        return assessment
+
+    return add
+
+
+def delete_positions(statements: list[str]) -> list[int]:
+    return [i for i, statement in enumerate(statements) if statement.startswith("DELETE")]
+
+
+# =============================================================================
+# Attachment Deletion Tests
+# =============================================================================
+
+
+class TestDeleteAttachments:
+    """Test streaming attachment deletion."""
+
+    @pytest.mark.usefixtures("storage_deletes")
+    async def test_deletes_rows_only_for_removed_objects(
+        self, db_session: AsyncSession, add_attachments
+    ):
+        """Test that rows whose storage delete failed are kept for a later retry."""
+        assessment = await add_attachments(["a-ok", "b-fail", "c-ok", "d-ok", "e-fail"])
+        service = CleanupService(db_session)
+
+        deleted, freed = await service._delete_orphaned_images_for_assessments([assessment.id])
+
+        assert (deleted, freed) == (3, 300)
+        result = await db_session.execute(
+            select(Attachment.storage_key).where(Attachment.assessment_id == assessment.id)
+        )
+        assert sorted(result.scalars()) == ["b-fail", "e-fail"]
+
+    async def test_streams_storage_deletes_before_row_deletes(
+        self,
+        db_session: AsyncSession,
+        statements: list[str],
+        storage_deletes: list,
+        add_attachments,
+    ):
+        """Test that storage is called per batch and rows are deleted after the cursor closes."""
+        keys = ["a-ok", "b-ok", "c-ok", "d-ok", "e-ok"]
+        assessment = await add_attachments(keys)
+        service = CleanupService(db_session)
+
+        statements.clear()
+        await service._delete_orphaned_images_for_assessments([assessment.id])
+
+        assert [len(batch) for _, batch in storage_deletes] == [2, 2, 1]
+        assert sorted(key for _, batch in storage_deletes for key in batch) == keys
+        last_storage_call = storage_deletes[-1][0]
+        assert delete_positions(statements)
+        assert min(delete_positions(statements)) >= last_storage_call
+
+    async def test_nothing_to_delete(
+        self, db_session: AsyncSession, statements: list[str], storage_deletes: list
+    ):
+        """Test that no matching attachments issues no storage or row deletes."""
+        service = CleanupService(db_session)
+
+        statements.clear()
+        assert await service._delete_orphaned_images_for_assessments([uuid4()]) == (0, 0)
+        assert storage_deletes == []
+        assert delete_positions(statements) == []
@@ -0,0 +1,217 @@
+"""Integration tests for respondent repository queries."""
+
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.enums import RespondentKind
+from src.models.respondent import Respondent
+from src.repositories.respondent import RespondentRepository
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def name_prefix() -> str:
+    """Unique name prefix so tests only see their own respondents."""
+    return f"Test-{uuid4().hex[:8]}"
+
+
+async def add_respondents(session: AsyncSession, *respondents: Respondent) -> None:
+    session.add_all(respondents)
+    await session.flush()
+    session.expunge_all()
+
+
+# =============================================================================
+# Listing Tests
+# =============================================================================
+
+
+class TestRespondentListing:
+    """Test the cached, raiseload'ed respondent listings."""
+
+    async def test_get_all_is_one_query(
+        self, db_session: AsyncSession, statements: list[str], name_prefix: str
+    ):
+        """Test that a filtered listing is a single SELECT."""
+        await add_respondents(
+            db_session,
+            Respondent(kind=RespondentKind.ORG, name=f"{name_prefix} B"),
+            Respondent(kind=RespondentKind.ORG, name=f"{name_prefix} A"),
+            Respondent(kind=RespondentKind.PERSON, name=f"{name_prefix} C"),
+        )
+        repo = RespondentRepository(db_session)
+
+        statements.clear()
+        respondents = await repo.get_all(kind=RespondentKind.ORG, name_search=name_prefix)
+
+        assert [r.name for r in respondents] == [f"{name_prefix} A", f"{name_prefix} B"]
+        assert len(statements) == 1
+
+    async def test_search_by_name_is_one_query(
+        self, db_session: AsyncSession, statements: list[str], name_prefix: str
+    ):
+        """Test that a name search is a single SELECT."""
+        await add_respondents(
+            db_session,
+            *(Respondent(kind=RespondentKind.ORG, name=f"{name_prefix} {i}") for i in range(3)),
+        )
+        repo = RespondentRepository(db_session)
+
+        statements.clear()
+        respondents = await repo.search_by_name(name_prefix, limit=2)
+
+        assert len(respondents) == 2
+        assert len(statements) == 1
+
+    async def test_search_by_empty_name_matches_all(
+        self, db_session: AsyncSession, name_prefix: str
+    ):
+        """Test that an empty search is an unfiltered, limited listing."""
+        await add_respondents(
+            db_session,
+            *(Respondent(kind=RespondentKind.ORG, name=f"{name_prefix} {i}") for i in range(2)),
+        )
+        repo = RespondentRepository(db_session)
+
+        respondents = await repo.search_by_name("", limit=1000)
+
+        names = {r.name for r in respondents}
+        assert {f"{name_prefix} 0", f"{name_prefix} 1"} <= names
+
+    async def test_listing_raises_on_lazy_load(self, db_session: AsyncSession, name_prefix: str):
+        """Test that listed respondents refuse to lazy-load relationships."""
+        await add_respondents(
+            db_session, Respondent(kind=RespondentKind.ORG, name=f"{name_prefix} A")
+        )
+        repo = RespondentRepository(db_session)
+
+        for respondents in (
+            await repo.get_all(name_search=name_prefix),
+            await repo.search_by_name(name_prefix),
+        ):
+            with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+                _ = respondents[0].assessments
+
+
+# =============================================================================
+# Odoo Upsert Tests
+# =============================================================================
+
+
+class TestUpsertFromOdoo:
+    """Test resolving Odoo respondents."""
+
+    async def test_new_without_registration_is_one_query(
+        self, db_session: AsyncSession, statements: list[str], name_prefix: str
+    ):
+        """Test that a respondent without registration_no is one INSERT ON CONFLICT."""
+        repo = RespondentRepository(db_session)
+        odoo_id = f"odoo-{uuid4()}"
+
+        statements.clear()
+        respondent = await repo.upsert_from_odoo(
+            odoo_id=odoo_id, name=name_prefix, kind=RespondentKind.ORG, registration_no=None
+        )
+
+        assert respondent.odoo_id == odoo_id
+        assert respondent.name == name_prefix
+        assert len(statements) == 1
+
+    async def test_known_odoo_id_is_one_query(
+        self, db_session: AsyncSession, statements: list[str], name_prefix: str
+    ):
+        """Test that refreshing a known respondent is a single statement."""
+        odoo_id = f"odoo-{uuid4()}"
+        await add_respondents(
+            db_session,
+            Respondent(kind=RespondentKind.ORG, name="Old", registration_no="R1", odoo_id=odoo_id),
+        )
+        repo = RespondentRepository(db_session)
+
+        statements.clear()
+        respondent = await repo.upsert_from_odoo(
+            odoo_id=odoo_id, name=name_prefix, kind=RespondentKind.ORG, registration_no="R2"
+        )
+
+        assert respondent.name == name_prefix
+        assert respondent.registration_no == "R2"
+        assert len(statements) == 1
+
+    async def test_links_legacy_respondent(self, db_session: AsyncSession, name_prefix: str):
+        """Test that a new odoo_id links the legacy respondent with the same registration."""
+        registration_no = uuid4().hex[:12]
+        legacy = Respondent(kind=RespondentKind.ORG, name="Legacy", registration_no=registration_no)
+        await add_respondents(db_session, legacy)
+        repo = RespondentRepository(db_session)
+        odoo_id = f"odoo-{uuid4()}"
+
+        respondent = await repo.upsert_from_odoo(
+            odoo_id=odoo_id,
+            name=name_prefix,
+            kind=RespondentKind.ORG,
+            registration_no=registration_no,
+        )
+
+        assert respondent.id == legacy.id
+        assert respondent.odoo_id == odoo_id
+        assert respondent.name == name_prefix
+
+    async def test_links_only_oldest_of_several_legacy_respondents(
+        self, db_session: AsyncSession, name_prefix: str
+    ):
+        """Test that duplicate legacy rows link one respondent, not all of them."""
+        registration_no = uuid4().hex[:12]
+        now = datetime.now(UTC)
+        older = Respondent(
+            kind=RespondentKind.ORG,
+            name="Older",
+            registration_no=registration_no,
+            created_at=now - timedelta(days=1),
+        )
+        newer = Respondent(
+            kind=RespondentKind.ORG, name="Newer", registration_no=registration_no, created_at=now
+        )
+        await add_respondents(db_session, newer, older)
+        repo = RespondentRepository(db_session)
+        odoo_id = f"odoo-{uuid4()}"
+
+        respondent = await repo.upsert_from_odoo(
+            odoo_id=odoo_id,
+            name=name_prefix,
+            kind=RespondentKind.ORG,
+            registration_no=registration_no,
+        )
+
+        assert respondent.id == older.id
+        unlinked = await repo.get_by_id(newer.id)
+        assert unlinked.odoo_id is None
+        assert unlinked.name == "Newer"
+
+    async def test_known_odoo_id_wins_over_legacy(self, db_session: AsyncSession, name_prefix: str):
+        """Test that a legacy respondent is left alone when odoo_id is already known."""
+        registration_no = uuid4().hex[:12]
+        odoo_id = f"odoo-{uuid4()}"
+        known = Respondent(kind=RespondentKind.ORG, name="Known", odoo_id=odoo_id)
+        legacy = Respondent(kind=RespondentKind.ORG, name="Legacy", registration_no=registration_no)
+        await add_respondents(db_session, known, legacy)
+        repo = RespondentRepository(db_session)
+
+        respondent = await repo.upsert_from_odoo(
+            odoo_id=odoo_id,
+            name=name_prefix,
+            kind=RespondentKind.ORG,
+            registration_no=registration_no,
+        )
+
+        assert respondent.id == known.id
+        assert respondent.registration_no == registration_no
+        untouched = await repo.get_by_id(legacy.id)
+        assert untouched.odoo_id is None
+        assert untouched.name == "Legacy"
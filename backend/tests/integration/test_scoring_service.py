@@ -0,0 +1,108 @@
+"""Integration tests for saving assessment scores."""
+
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.assessment_score import AssessmentScore
+from src.models.enums import RiskRating
+from src.services.scoring import (
+    GroupScoreResult,
+    OverallScoreResult,
+    ScoringService,
+    TypeScoreResult,
+)
+
+
+def group_score(name: str, raw_score: int) -> GroupScoreResult:
+    return GroupScoreResult(
+        group_id=str(uuid4()),
+        group_name=name,
+        raw_score=raw_score,
+        max_score=2,
+        percentage=raw_score * 50.0,
+        risk_rating=RiskRating.LOW,
+        weight=1.0,
+        sum_score=raw_score,
+        classification_label="Хэвийн",
+        numeric_value=1,
+    )
+
+
+def type_score(groups: list[GroupScoreResult]) -> TypeScoreResult:
+    return TypeScoreResult(
+        type_id=str(uuid4()),
+        type_name="Type",
+        raw_score=sum(g.raw_score for g in groups),
+        max_score=2 * len(groups),
+        percentage=33.333,
+        risk_rating=RiskRating.MEDIUM,
+        weight=1.0,
+        groups=groups,
+        probability_score=1.5,
+        consequence_score=2.25,
+        risk_value=3,
+        risk_grade="AA",
+        risk_description="Эрсдэл бага",
+    )
+
+
+class TestSaveScores:
+    """Test persisting group, type and overall scores."""
+
+    async def test_saves_every_level_in_one_statement(
+        self, db_session: AsyncSession, statements: list[str], make_assessment
+    ):
+        """Test that all score rows are written by a single INSERT."""
+        assessment = await make_assessment()
+        types = [
+            type_score([group_score("G1", 1), group_score("G2", 0)]),
+            type_score([group_score("G3", 2)]),
+        ]
+        overall = OverallScoreResult(
+            raw_score=3,
+            max_score=6,
+            percentage=50.0,
+            risk_rating=RiskRating.MEDIUM,
+            risk_value=3,
+            risk_grade="AA",
+            risk_description="Эрсдэл бага",
+            insurance_decision="Даатгана",
+        )
+
+        statements.clear()
+        await ScoringService(db_session).save_scores(assessment.id, types, overall)
+
+        assert len(statements) == 1
+        assert statements[0].startswith("INSERT INTO assessment_scores")
+        result = await db_session.execute(
+            select(AssessmentScore).where(AssessmentScore.assessment_id == assessment.id)
+        )
+        rows = result.scalars().all()
+        assert len(rows) == 3 + 2 + 1
+
+        group_rows = {str(r.group_id): r for r in rows if r.group_id is not None}
+        for ts in types:
+            for gs in ts.groups:
+                row = group_rows[gs.group_id]
+                assert str(row.type_id) == ts.type_id
+                assert row.raw_score == gs.raw_score
+                assert row.classification_label == "Хэвийн"
+                assert row.risk_value is None
+
+        type_rows = [r for r in rows if r.group_id is None and r.type_id is not None]
+        assert {str(r.type_id) for r in type_rows} == {ts.type_id for ts in types}
+        for row in type_rows:
+            assert row.percentage == Decimal("33.33")
+            assert row.probability_score == Decimal("1.5")
+            assert row.consequence_score == Decimal("2.25")
+            assert row.risk_grade == "AA"
+            assert row.insurance_decision is None
+
+        (overall_row,) = [r for r in rows if r.type_id is None]
+        assert overall_row.group_id is None
+        assert overall_row.raw_score == 3
+        assert overall_row.insurance_decision == "Даатгана"
+        assert overall_row.classification_label is None
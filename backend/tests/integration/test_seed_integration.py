@@ -16,7 +16,12 @@ from src.seeds.questions_seed import (
     create_questionnaire_type,
     create_question_group,
     create_question,
+    insert_question_group,
+    insert_questionnaire_type,
+    plan_group_questions,
     seed_questions,
+    write_pending_rows,
+    PendingRows,
     SeedStats,
 )
 
@@ -645,6 +650,55 @@ class TestSeedEdgeCaseRecovery:
             os.chdir(original_cwd)
 
 
+class TestWritePendingRows:
+    """Test writing a file's collected rows."""
+
+    async def test_writes_new_and_updated_rows(self, db_session: AsyncSession):
+        """Test that planned inserts, reorders and score changes all reach the database."""
+        type_id = await insert_questionnaire_type(db_session, f"PENDING TYPE {uuid4()}")
+        group_id = await insert_question_group(db_session, type_id, "PENDING GROUP", 1)
+        existing = {}
+
+        rows = PendingRows()
+        plan_group_questions(rows, group_id, [("Q1", 1, 0), ("Q2", 0, 1)], existing)
+        await write_pending_rows(db_session, rows)
+
+        # Second run: Q2 moves first with new scores, Q3 is new
+        rows = PendingRows()
+        rows.group_orders[group_id] = 2
+        plan_group_questions(
+            rows, group_id, [("Q2", 1, 0), ("Q1", 1, 0), ("Q3", 0, 0)], existing
+        )
+        await write_pending_rows(db_session, rows)
+
+        result = await db_session.execute(
+            select(Question.text, Question.display_order)
+            .where(Question.group_id == group_id)
+            .order_by(Question.display_order)
+        )
+        assert result.all() == [("Q2", 1), ("Q1", 2), ("Q3", 3)]
+
+        result = await db_session.execute(
+            select(Question.text, QuestionOption.option_type, QuestionOption.score)
+            .join(QuestionOption, QuestionOption.question_id == Question.id)
+            .where(Question.group_id == group_id)
+        )
+        scores = {(text, option_type): score for text, option_type, score in result}
+        assert scores == {
+            ("Q1", OptionType.NO): 1,
+            ("Q1", OptionType.YES): 0,
+            ("Q2", OptionType.NO): 1,
+            ("Q2", OptionType.YES): 0,
+            ("Q3", OptionType.NO): 0,
+            ("Q3", OptionType.YES): 0,
+        }
+
+        group_order = await db_session.scalar(
+            select(QuestionGroup.display_order).where(QuestionGroup.id == group_id)
+        )
+        assert group_order == 2
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -3,15 +3,19 @@
 import pytest
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from uuid import uuid4
 
+from src.models.enums import OptionType
 from src.seeds.questions_seed import (
     ParsedQuestion,
     ParsedGroup,
     ParsedType,
     ParsedQuestionData,
+    PendingRows,
     calculate_scores,
     parse_question_line,
     parse_markdown_file,
+    plan_group_questions,
 )
 
 
@@ -360,3 +364,85 @@ class TestEdgeCaseHandling:
         no_score, yes_score = calculate_scores("Invalid", 1)
         # Returns (0, 0) since it's not "Үгүй" or "Тийм"
         assert (no_score, yes_score) == (0, 0)
+
+
+# =============================================================================
+# Row Planning Tests
+# =============================================================================
+
+
+class TestPlanGroupQuestions:
+    """Test collecting a group's question and option rows."""
+
+    def test_new_questions(self):
+        """Test that unknown questions become new rows with both options."""
+        rows = PendingRows()
+        group_id = uuid4()
+        existing = {}
+
+        plan_group_questions(rows, group_id, [("Q1", 1, 0), ("Q2", 0, 1)], existing)
+
+        assert [(q["text"], q["display_order"]) for q in rows.questions] == [
+            ("Q1", 1),
+            ("Q2", 2),
+        ]
+        assert all(q["group_id"] == group_id for q in rows.questions)
+        assert len(rows.options) == 4
+        q1_id = rows.questions[0]["id"]
+        assert rows.options[(q1_id, OptionType.NO)]["score"] == 1
+        assert rows.options[(q1_id, OptionType.YES)]["score"] == 0
+        assert existing == {"Q1": (q1_id, 1), "Q2": (rows.questions[1]["id"], 2)}
+
+    def test_existing_questions_only_reorder(self):
+        """Test that known questions are reordered, not inserted."""
+        rows = PendingRows()
+        q1_id, q2_id = uuid4(), uuid4()
+        existing = {"Q1": (q1_id, 1), "Q2": (q2_id, 2)}
+
+        plan_group_questions(rows, uuid4(), [("Q2", 1, 0), ("Q1", 0, 1)], existing)
+
+        assert rows.questions == []
+        assert rows.question_orders == {q2_id: 1, q1_id: 2}
+        assert set(rows.options) == {
+            (q1_id, OptionType.NO),
+            (q1_id, OptionType.YES),
+            (q2_id, OptionType.NO),
+            (q2_id, OptionType.YES),
+        }
+        assert existing == {"Q1": (q1_id, 2), "Q2": (q2_id, 1)}
+
+    def test_unchanged_order_is_not_updated(self):
+        """Test that a question already in place collects no order update."""
+        rows = PendingRows()
+        q1_id = uuid4()
+
+        plan_group_questions(rows, uuid4(), [("Q1", 1, 0)], {"Q1": (q1_id, 1)})
+
+        assert rows.question_orders == {}
+        assert rows.options[(q1_id, OptionType.NO)]["score"] == 1
+
+    def test_repeated_text_later_occurrence_wins(self):
+        """Test that a question repeated in a file is one row with the last order and scores."""
+        rows = PendingRows()
+
+        plan_group_questions(rows, uuid4(), [("Q1", 1, 0), ("Q2", 0, 0), ("Q1", 0, 1)], {})
+
+        assert [(q["text"], q["display_order"]) for q in rows.questions] == [
+            ("Q1", 3),
+            ("Q2", 2),
+        ]
+        q1_id = rows.questions[0]["id"]
+        assert rows.options[(q1_id, OptionType.NO)]["score"] == 0
+        assert rows.options[(q1_id, OptionType.YES)]["score"] == 1
+
+    def test_invalid_score_collects_nothing(self):
+        """Test that an invalid score raises before any row is collected."""
+        rows = PendingRows()
+        existing = {}
+
+        with pytest.raises(ValueError, match="Invalid scores"):
+            plan_group_questions(rows, uuid4(), [("Q1", 1, 0), ("Q2", 2, 0)], existing)
+
+        assert rows.questions == []
+        assert rows.options == {}
+        assert existing == {}